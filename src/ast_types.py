@@ -1,10 +1,13 @@
+from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any
-from llvmlite import ir
+from typing import TYPE_CHECKING, Any
 from lexer_token import Token
 from semantic_types import Scope, Symbol, Type
 
+if TYPE_CHECKING:
+    from llvmlite import ir
+
 
 class ASTOperator(Enum):
     ADD_OPERATOR = auto()
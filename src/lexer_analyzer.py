@@ -1,18 +1,13 @@
-from lexer_token import TokenType, Token
+from lexer_token import TokenType, TokenArray, TriviaFilter
+from lexer_driver import analyzeScannedSource
+from lexer_characters import classifyCharacters
 import lexer_recognizers as recognizers
-from lexer_types import LexerTokenTypeAcceptState, LexerTokenTypeState
-
-
-initial_lexer: list[LexerTokenTypeState] = []
-
-
-def getFreshLexer():
-    initial_lexer = []
-    for x in range(len(TokenType) - 1):  # exclude INVALID
-        initial_lexer.append(
-            LexerTokenTypeState(LexerTokenTypeAcceptState.IN_PROGRESS, -1)
-        )
-    return initial_lexer
+from lexer_types import (
+    LexerMode,
+    LexerProfile,
+    LexerTokenTypeAcceptState,
+    LexerTokenTypeState,
+)
 
 
 recognizer_list = []
@@ -182,71 +177,151 @@ recognizer_list[TokenType.VERTICAL_BAR_DELIMITER.value] = (
 recognizer_list[TokenType.ENDMARKER.value] = recognizers.nullRecognizer
 
 
-def analyzeSource(code: str):
-    tokens: list[Token] = []
-    start_index = 0
-    current_state = getFreshLexer()
-
-    def pickLongestState(current_state):
-        longest = -1
-        longest_type = TokenType.INVALID
-        for state_index in range(len(current_state)):
-            type = TokenType(state_index)
-            state = current_state[state_index]
-            if state.end_at == -1:
-                continue
-            if state.end_at > longest or (
-                state.end_at == longest and type.value > longest_type.value
-            ):
-                longest = state.end_at
-                longest_type = type
-        if longest == -1 or longest_type == TokenType.INVALID:
-            return (None, TokenType.INVALID)
-        else:
-            return (longest, longest_type)
-
-    index = 0
-
-    while index < len(code):
-        valid_states: list[TokenType] = []
-        for state_index in range(len(current_state)):
-            type = TokenType(state_index)
-            state = current_state[state_index]
-
-            if state.acceptance == LexerTokenTypeAcceptState.REJECTED:
-                continue
-            state = recognizer_list[type.value](state, code[index])
-
-            if state.acceptance == LexerTokenTypeAcceptState.ACCEPTED:
-                state.end_at = index + 1
-            if state.acceptance != LexerTokenTypeAcceptState.REJECTED:
-                valid_states.append(type)
-            current_state[state_index] = state
-        if valid_states:
-            index += 1
-            continue
-
-        longest_end, longest_type = pickLongestState(current_state)
-        if longest_end is None or longest_type == TokenType.INVALID:
-            invalid_start = start_index if start_index == index else index
-            tokens.append(Token(longest_type, invalid_start, invalid_start + 1))
-            start_index = invalid_start + 1
-            index = start_index
-            current_state = getFreshLexer()
-            continue
-        tokens.append(Token(longest_type, start_index, longest_end))
-        start_index = longest_end
+fresh_states = [0] * len(recognizer_list)
+fresh_acceptances = [LexerTokenTypeAcceptState.IN_PROGRESS] * len(recognizer_list)
+
+
+def profileRecognizer(recognizer, type_value: int, profile: LexerProfile):
+    invocations = profile.invocations
+    live_characters = profile.live_characters
+    REJECTED = LexerTokenTypeAcceptState.REJECTED
+
+    def profiledRecognizer(state: LexerTokenTypeState, character: str):
+        invocations[type_value] += 1
+        result = recognizer(state, character)
+        if result.acceptance != REJECTED:
+            live_characters[type_value] += 1
+        return result
+
+    return profiledRecognizer
+
+
+def analyzeSourceRecognizers(
+    code: str, tokens: TokenArray | None = None, profile: LexerProfile | None = None
+):
+    code_length = len(code)
+    recognizers = recognizer_list
+    if profile is not None:
+        # Counters grow to cover the recognizers, so one profile can be
+        # reused across several sources
+        for counters in [profile.invocations, profile.live_characters, profile.wins]:
+            counters.extend([0] * (len(recognizer_list) - len(counters)))
+        recognizers = [
+            profileRecognizer(recognizer, type_value, profile)
+            for type_value, recognizer in enumerate(recognizer_list)
+        ]
+    recognizer_range = range(len(recognizers))
+    REJECTED = LexerTokenTypeAcceptState.REJECTED
+    ACCEPTED = LexerTokenTypeAcceptState.ACCEPTED
+    # One state object is reused for every recognizer call, the per-recognizer
+    # state lives in parallel arrays that are reset by slice assignment
+    current_states = list(fresh_states)
+    acceptances = list(fresh_acceptances)
+    state = LexerTokenTypeState(LexerTokenTypeAcceptState.IN_PROGRESS)
+    # Each position is classified once instead of once per recognizer
+    classes = classifyCharacters(code)
+
+    def scan(start_index: int):
+        current_states[:] = fresh_states
+        acceptances[:] = fresh_acceptances
+        longest_end = -1
+        longest_type = -1
         index = start_index
-        current_state = getFreshLexer()
+        while index < code_length:
+            character = code[index]
+            state.character_class = classes[index]
+            in_progress = False
+            for type_value in recognizer_range:
+                if acceptances[type_value] == REJECTED:
+                    continue
+                state.current_state = current_states[type_value]
+                state.acceptance = acceptances[type_value]
+                result = recognizers[type_value](state, character)
+                acceptances[type_value] = result.acceptance
+                if result.acceptance == REJECTED:
+                    continue
+                current_states[type_value] = result.current_state
+                in_progress = True
+                if result.acceptance == ACCEPTED:
+                    longest_end = index + 1
+                    longest_type = type_value
+            if not in_progress:
+                return longest_end, longest_type, index
+            index += 1
+        return longest_end, longest_type, code_length
+
+    if profile is not None:
+        wins = profile.wins
+        unprofiled_scan = scan
+
+        def scan(start_index: int):
+            result = unprofiled_scan(start_index)
+            if result[0] != -1:
+                wins[result[1]] += 1
+            return result
+
+    skip = None
+    # The DFA tables are only needed to skip merged INVALID runs, the
+    # playground loads the recognizer engine without them
+    if tokens is not None and tokens.coalesce_invalid:
+        from lexer_dfa import makeInvalidSkip
+
+        skip = makeInvalidSkip(code)
+    return analyzeScannedSource(code_length, scan, tokens, skip)
+
+
+def analyzeSource(
+    code: str,
+    mode: LexerMode = LexerMode.RECOGNIZER,
+    tokens: TokenArray | None = None,
+    cache=None,
+    skip_trivia: bool = False,
+    trivia: TokenArray | None = None,
+    positions: bool = False,
+    coalesce_invalid: bool = False,
+    profile: LexerProfile | None = None,
+):
+    if profile is not None and mode != LexerMode.RECOGNIZER:
+        raise ValueError(f"Profiling needs LexerMode.RECOGNIZER, not {mode.name}")
+    if positions or coalesce_invalid:
+        output = TokenArray() if tokens is None else tokens
+        if positions:
+            output.trackPositions(code)
+            if trivia is not None:
+                trivia.trackPositions(code)
+        output.coalesce_invalid = coalesce_invalid
+        analyzeSource(code, mode, output, cache, skip_trivia, trivia, profile=profile)
+        return output.toList() if tokens is None else output
+    if skip_trivia or trivia is not None:
+        output = TokenArray() if tokens is None else tokens
+        analyzeSource(code, mode, TriviaFilter(output, trivia), cache, profile=profile)
+        return output.toList() if tokens is None else output
+    # A cache hit would skip the recognizers the profile is meant to count
+    if cache is not None and profile is None:
+        return cache.analyzeSource(code, mode, tokens)
+    if mode == LexerMode.DFA:
+        from lexer_dfa import analyzeSourceDfa
+
+        return analyzeSourceDfa(code, tokens)
+    if mode == LexerMode.DISPATCH:
+        from lexer_dispatch import analyzeSourceDispatch
+
+        return analyzeSourceDispatch(code, tokens)
+    if mode == LexerMode.KEYWORD:
+        from lexer_keywords import analyzeSourceKeywords
+
+        return analyzeSourceKeywords(code, tokens)
+    if mode == LexerMode.REGEX:
+        from lexer_regex import analyzeSourceRegex
+
+        return analyzeSourceRegex(code, tokens)
+    if mode == LexerMode.PARALLEL:
+        from lexer_parallel import analyzeSourceParallel
 
-    # Potentially cut off state
-    longest_end, longest_type = pickLongestState(current_state)
-    if longest_end is None or longest_type == TokenType.INVALID:
-        if start_index < len(code):
-            tokens.append(Token(longest_type, start_index, len(code)))
-    else:
-        tokens.append(Token(longest_type, start_index, longest_end))
+        return analyzeSourceParallel(code, tokens)
+    if mode == LexerMode.GENERATED:
+        from lexer_codegen import analyzeSourceGenerated
 
-    tokens.append(Token(TokenType.ENDMARKER, len(code), len(code)))
+        return analyzeSourceGenerated(code, tokens)
 
-    return tokens
+    return analyzeSourceRecognizers(code, tokens, profile)
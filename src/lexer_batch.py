@@ -0,0 +1,116 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer_token import TokenArray
+from lexer_types import LexerFileResult
+from lexer_cache import TokenCache
+import lexer_dfa
+import lexer_mmap
+
+
+worker_cache: TokenCache | None = None
+
+
+def initializeWorker(cache_directory: str | None = None):
+    global worker_cache
+    lexer_dfa.getDfaTables()
+    if cache_directory is not None:
+        worker_cache = TokenCache(cache_directory)
+
+
+def analyzeCachedFile(path: str):
+    if worker_cache is None:
+        return lexer_mmap.analyzeFile(path, TokenArray())
+    with open(path, "rb") as file:
+        data = file.read()
+    tokens = worker_cache.get(data, "file")
+    if tokens is None:
+        tokens = lexer_mmap.analyzeFile(path, TokenArray())
+        worker_cache.put(data, tokens, "file")
+    return tokens
+
+
+def lexFile(path: str) -> LexerFileResult:
+    start = time.perf_counter()
+    try:
+        tokens = analyzeCachedFile(path)
+    except (OSError, ValueError) as error:
+        return LexerFileResult(
+            path, None, elapsed=time.perf_counter() - start, error=repr(error)
+        )
+    return LexerFileResult(
+        path,
+        tokens,
+        characters=tokens.starts[-1],
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def expandPaths(paths: list[str], extension: str | None = None):
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for directory, subdirectories, files in os.walk(path):
+            subdirectories.sort()
+            for name in sorted(files):
+                if extension is None or name.endswith(extension):
+                    yield os.path.join(directory, name)
+
+
+def lexMany(
+    paths: list[str],
+    workers: int | None = None,
+    chunk_size: int = 16,
+    extension: str | None = None,
+    cache_directory: str | None = None,
+):
+    files = list(expandPaths(paths, extension))
+    # Tables are built before the pool starts so forked workers share them
+    lexer_dfa.getDfaTables()
+    with ProcessPoolExecutor(
+        workers, initializer=initializeWorker, initargs=(cache_directory,)
+    ) as executor:
+        yield from executor.map(lexFile, files, chunksize=chunk_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lex many files in parallel")
+    parser.add_argument("paths", nargs="+", help="files or directories to lex")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--extension", default=None, help="e.g. .num")
+    parser.add_argument("--cache", default=None, help="token cache directory")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    files = 0
+    failed = 0
+    characters = 0
+    token_count = 0
+    start = time.perf_counter()
+    for result in lexMany(
+        args.paths, args.workers, args.chunk_size, args.extension, args.cache
+    ):
+        files += 1
+        if result.error is not None:
+            failed += 1
+            print(f"{result.path}: error: {result.error}")
+            continue
+        characters += result.characters
+        token_count += len(result.tokens)
+        if not args.quiet:
+            print(f"{result.path}: {len(result.tokens)} tokens")
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"files={files} failed={failed} chars={characters} tokens={token_count} "
+        f"time={elapsed:.3f}s chars/s={characters / max(elapsed, 1e-9):.0f} "
+        f"tokens/s={token_count / max(elapsed, 1e-9):.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
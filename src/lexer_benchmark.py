@@ -0,0 +1,212 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import lexer_analyzer
+from lexer_analyzer import analyzeSource
+from lexer_types import LexerMode
+
+
+SAMPLE_SOURCE = """func average(int<km> distance, float<percent> rate | float) {
+    // running total over the week
+    float<meter> total = 0.0;
+    for (int i = 0; i < 10; i++) {
+        total += distance * rate; /* scaled */
+        if (total >= 100.5 && !done) {
+            stop;
+        }
+    }
+    print("total: ", total, 'c');
+    return total;
+}
+"""
+
+RECOGNIZER_MODES = [LexerMode.RECOGNIZER, LexerMode.DISPATCH, LexerMode.KEYWORD]
+
+IDENTIFIER_WORDS = ["alpha", "beta_2", "gamma", "delta_value", "x", "kmh", "intx"]
+UNIT_TYPES = ["km", "meter2", "celc", "mps2", "percent", "kg", "hour", "inch"]
+OPERATORS = ["+=", "-%", "*%", "++", "--", "<=", ">=", "!=", "&&", "||", "^", "%"]
+
+
+def repeatToSize(parts: list[str], size: int):
+    pieces = []
+    length = 0
+    index = 0
+    while length < size:
+        piece = parts[index % len(parts)]
+        pieces.append(piece)
+        length += len(piece)
+        index += 1
+    return "".join(pieces)
+
+
+def buildCorpora(size: int):
+    return {
+        "identifiers": repeatToSize(
+            [f"{word}, " for word in IDENTIFIER_WORDS] + ["\n"], size
+        ),
+        "unit_types": repeatToSize(
+            [
+                f"float<{unit}> value_{index} = {index}.5;\n"
+                for index, unit in enumerate(UNIT_TYPES)
+            ],
+            size,
+        ),
+        "long_comments": repeatToSize(
+            ["/* " + "long block comment text " * 40 + "*/\n"]
+            + ["// " + "line comment text " * 20 + "\n"],
+            size,
+        ),
+        "long_strings": repeatToSize(
+            ['print("' + 'string literal body \\" ' * 40 + '");\n'], size
+        ),
+        "operator_soup": repeatToSize(
+            [f"a{operator}b " for operator in OPERATORS] + ["\n"], size
+        ),
+        "mixed": repeatToSize([SAMPLE_SOURCE], size),
+    }
+
+
+def countRecognizerCalls(code: str, mode: LexerMode):
+    calls = 0
+    original_recognizers = list(lexer_analyzer.recognizer_list)
+
+    def countingRecognizer(recognizer):
+        def wrapper(state, character):
+            nonlocal calls
+            calls += 1
+            return recognizer(state, character)
+
+        return wrapper
+
+    # Warm up lazily built indexes so their construction is not counted
+    analyzeSource(code[:1], mode)
+    for type_value, recognizer in enumerate(original_recognizers):
+        lexer_analyzer.recognizer_list[type_value] = countingRecognizer(recognizer)
+    try:
+        start = time.perf_counter()
+        tokens = analyzeSource(code, mode)
+        elapsed = time.perf_counter() - start
+    finally:
+        lexer_analyzer.recognizer_list[:] = original_recognizers
+    return calls, len(tokens), elapsed
+
+
+def timeMode(code: str, mode: LexerMode, repeat: int):
+    analyzeSource(code[:1], mode)
+    elapsed = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = analyzeSource(code, mode)
+        run_time = time.perf_counter() - start
+        elapsed = run_time if elapsed is None else min(elapsed, run_time)
+    return elapsed, tokens
+
+
+def measureTokenClasses(code: str, tokens: list, mode: LexerMode, repeat: int):
+    lexemes: dict[str, list[str]] = {}
+    for token in tokens:
+        if token.start < token.end:
+            lexemes.setdefault(token.type.name, []).append(
+                code[token.start : token.end]
+            )
+    # Each class is timed on its own lexemes, separated by newlines that are
+    # timed along but not counted as chars or tokens of the class
+    token_classes = {}
+    for name, parts in lexemes.items():
+        elapsed, _ = timeMode("\n".join(parts), mode, repeat)
+        chars = sum(len(part) for part in parts)
+        token_classes[name] = {
+            "tokens": len(parts),
+            "chars": chars,
+            "seconds": elapsed,
+            "chars_per_second": chars / max(elapsed, 1e-9),
+            "tokens_per_second": len(parts) / max(elapsed, 1e-9),
+        }
+    return token_classes
+
+
+def measureMode(code: str, mode: LexerMode, repeat: int):
+    elapsed, tokens = timeMode(code, mode, repeat)
+    tracemalloc.start()
+    try:
+        analyzeSource(code, mode)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    calls_per_char = None
+    if mode in RECOGNIZER_MODES:
+        calls, _, _ = countRecognizerCalls(code, mode)
+        calls_per_char = calls / max(len(code), 1)
+    return {
+        "chars": len(code),
+        "tokens": len(tokens),
+        "seconds": elapsed,
+        "chars_per_second": len(code) / max(elapsed, 1e-9),
+        "tokens_per_second": len(tokens) / max(elapsed, 1e-9),
+        "peak_memory_bytes": peak_memory,
+        "recognizer_calls_per_char": calls_per_char,
+        "token_classes": measureTokenClasses(code, tokens, mode, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lexer engines")
+    parser.add_argument("files", nargs="*", help="extra corpora to measure")
+    parser.add_argument("--modes", nargs="*", default=None, help="e.g. DFA REGEX")
+    parser.add_argument("--size", type=int, default=20000, help="chars per corpus")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="JSON results file")
+    parser.add_argument(
+        "--classes", action="store_true", help="print throughput per token class"
+    )
+    args = parser.parse_args()
+
+    modes = list(LexerMode)
+    if args.modes:
+        modes = [LexerMode[name] for name in args.modes]
+    corpora = buildCorpora(args.size)
+    for path in args.files:
+        with open(path, "r") as file:
+            corpora[path] = file.read()
+
+    results = []
+    for corpus_name, code in corpora.items():
+        for mode in modes:
+            result = measureMode(code, mode, args.repeat)
+            result["corpus"] = corpus_name
+            result["mode"] = mode.name
+            results.append(result)
+            calls_per_char = result["recognizer_calls_per_char"]
+            print(
+                f"{corpus_name:<14} {mode.name:<11} "
+                f"chars/s={result['chars_per_second']:>10.0f} "
+                f"tokens/s={result['tokens_per_second']:>9.0f} "
+                f"peak={result['peak_memory_bytes'] / 1024:>8.1f}KiB "
+                "calls/char="
+                + ("-" if calls_per_char is None else f"{calls_per_char:.2f}")
+            )
+            if args.classes:
+                token_classes = sorted(
+                    result["token_classes"].items(),
+                    key=lambda item: item[1]["chars_per_second"],
+                )
+                for name, token_class in token_classes:
+                    print(
+                        f"    {name:<26} "
+                        f"chars/s={token_class['chars_per_second']:>10.0f} "
+                        f"tokens/s={token_class['tokens_per_second']:>9.0f} "
+                        f"tokens={token_class['tokens']}"
+                    )
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(
+                {"python": sys.version.split()[0], "results": results}, file, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import hashlib
+import os
+import struct
+from array import array
+
+from lexer_token import TokenArray
+from lexer_types import LexerMode
+from lexer_tables import tablesVersion
+
+
+CACHE_MAGIC = b"NTC1"
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+def defaultCacheDirectory():
+    return os.environ.get(
+        "NUMANTICS_LEXER_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "numantics-lexer"),
+    )
+
+
+def encodeTokens(tokens: TokenArray) -> bytes:
+    return b"".join(
+        [
+            CACHE_MAGIC,
+            struct.pack("<Q", len(tokens)),
+            bytes(tokens.types),
+            bytes(tokens.starts),
+            bytes(tokens.ends),
+        ]
+    )
+
+
+def decodeTokens(data: bytes) -> TokenArray | None:
+    if data[:4] != CACHE_MAGIC or len(data) < 12:
+        return None
+    (count,) = struct.unpack_from("<Q", data, 4)
+    types = array("B")
+    starts = array("q")
+    ends = array("q")
+    offset = 12
+    if len(data) != offset + count * (types.itemsize + starts.itemsize * 2):
+        return None
+    types.frombytes(data[offset : offset + count])
+    offset += count
+    starts.frombytes(data[offset : offset + count * starts.itemsize])
+    offset += count * starts.itemsize
+    ends.frombytes(data[offset:])
+    return TokenArray(types, starts, ends)
+
+
+class TokenCache:
+    def __init__(self, directory: str | None = None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = defaultCacheDirectory() if directory is None else directory
+        self.max_bytes = max_bytes
+        self.version = tablesVersion()
+        # Scanning the directory on every store is slow for large caches, so
+        # eviction runs once enough new bytes were written
+        self.unchecked_bytes = max_bytes
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError:
+            pass
+
+    def entryPath(self, data: bytes, namespace: str):
+        # The lexer version is part of the key, entries from older tables are
+        # never hit again and age out through eviction
+        digest = hashlib.sha256(f"{self.version}:{namespace}:".encode())
+        digest.update(data)
+        return os.path.join(self.directory, digest.hexdigest() + ".tokens")
+
+    def get(self, data: bytes, namespace: str = "source") -> TokenArray | None:
+        path = self.entryPath(data, namespace)
+        try:
+            with open(path, "rb") as file:
+                tokens = decodeTokens(file.read())
+            # The modification time doubles as the last use for eviction
+            os.utime(path)
+        except OSError:
+            return None
+        return tokens
+
+    def put(self, data: bytes, tokens: TokenArray, namespace: str = "source"):
+        path = self.entryPath(data, namespace)
+        encoded = encodeTokens(tokens)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        # A read-only or full cache directory only costs the cache hit
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(encoded)
+            os.replace(temporary_path, path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            return
+        self.unchecked_bytes += len(encoded)
+        if self.unchecked_bytes > self.max_bytes // 16:
+            self.evict()
+
+    def evict(self):
+        self.unchecked_bytes = 0
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scanned:
+            for entry in scanned:
+                if not entry.name.endswith(".tokens"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def analyzeSource(
+        self,
+        code: str,
+        mode: LexerMode = LexerMode.RECOGNIZER,
+        tokens: TokenArray | None = None,
+    ):
+        from lexer_analyzer import analyzeSource
+
+        data = code.encode("utf-8", "surrogatepass")
+        cached = self.get(data)
+        if cached is None:
+            cached = analyzeSource(code, mode, TokenArray())
+            self.put(data, cached)
+        if tokens is None:
+            return cached.toList()
+        tokens.extend(cached)
+        return tokens
@@ -0,0 +1,68 @@
+CHARACTER_ALPHA = 1
+CHARACTER_DIGIT = 2
+CHARACTER_ALNUM = 4
+CHARACTER_SPACE = 8
+CHARACTER_IDENTIFIER_START = 16
+CHARACTER_IDENTIFIER_PART = 32
+# Whitespace other than the newline, which is a token of its own
+CHARACTER_BLANK = 64
+
+
+def computeCharacterClass(character: str):
+    character_class = 0
+    if character.isalpha():
+        character_class |= CHARACTER_ALPHA
+    if character.isdigit():
+        character_class |= CHARACTER_DIGIT
+    if character.isalnum():
+        character_class |= CHARACTER_ALNUM
+    if character.isspace():
+        character_class |= CHARACTER_SPACE
+        if character != "\n":
+            character_class |= CHARACTER_BLANK
+    if character.isalpha() or character == "_":
+        character_class |= CHARACTER_IDENTIFIER_START
+    if character.isalnum() or character == "_":
+        character_class |= CHARACTER_IDENTIFIER_PART
+    return character_class
+
+
+ascii_character_classes = [computeCharacterClass(chr(code)) for code in range(128)]
+
+
+class UnicodeCharacterClasses(dict):
+    def __missing__(self, character: str):
+        character_class = computeCharacterClass(character)
+        self[character] = character_class
+        return character_class
+
+
+unicode_character_classes = UnicodeCharacterClasses()
+
+
+def characterClass(character: str):
+    if character < "\x80":
+        return ascii_character_classes[ord(character)]
+    return unicode_character_classes[character]
+
+
+class FlagClassTranslation(dict):
+    def __init__(self):
+        super().__init__(
+            (code, chr(character_class))
+            for code, character_class in enumerate(ascii_character_classes)
+        )
+
+    def __missing__(self, code_point: int):
+        character_class = chr(unicode_character_classes[chr(code_point)])
+        self[code_point] = character_class
+        return character_class
+
+
+flag_translation = FlagClassTranslation()
+
+
+def classifyCharacters(code: str) -> bytes:
+    # Every class fits in a byte, so the whole source is classified by one
+    # translate call instead of a predicate call per character and recognizer
+    return code.translate(flag_translation).encode("latin-1")
@@ -0,0 +1,336 @@
+import hashlib
+import importlib.util
+import os
+import re
+from functools import partial
+
+from lexer_token import TokenArray
+from lexer_types import LexerDfaTables
+from lexer_driver import analyzeScannedSource
+import lexer_dfa
+import lexer_tables
+
+
+GENERATED_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "lexer_generated.py"
+)
+# The tokenizer refuses more than 100 indentation levels, states nested
+# deeper than this are reached through the dispatch loop instead
+MAX_INLINE_DEPTH = 60
+MAX_TESTED_TARGETS = 4
+
+generated_version: str | None = None
+
+
+def generatorVersion():
+    global generated_version
+    if generated_version is None:
+        digest = hashlib.sha256(lexer_tables.tablesVersion().encode())
+        with open(os.path.abspath(__file__), "rb") as file:
+            digest.update(file.read())
+        generated_version = digest.hexdigest()[:16]
+    return generated_version
+
+
+def stateBranches(tables: LexerDfaTables, state: int):
+    row = tables.transitions[state]
+    characters: dict[int, str] = {}
+    for point in range(128):
+        target = row[tables.character_classes[chr(point)]]
+        characters[target] = characters.get(target, "") + chr(point)
+    signatures: dict[int, set[tuple[bool, bool, bool, bool]]] = {}
+    for signature, character_class in tables.signature_classes.items():
+        signatures.setdefault(row[character_class], set()).add(signature)
+    return characters, signatures
+
+
+SIGNATURE_TESTS = [
+    ("character.isalpha()", lambda signature: signature[0]),
+    ("character.isalnum()", lambda signature: signature[1]),
+    ("character.isdigit()", lambda signature: signature[2]),
+    ("character.isspace()", lambda signature: signature[3]),
+    ("not character.isalpha()", lambda signature: not signature[0]),
+    ("not character.isalnum()", lambda signature: not signature[1]),
+    ("not character.isdigit()", lambda signature: not signature[2]),
+    ("not character.isspace()", lambda signature: not signature[3]),
+]
+
+
+def signatureTest(tables: LexerDfaTables, signatures: set):
+    # Recognizers only see non-ASCII characters through these four predicates,
+    # one of them usually tells the signatures apart on its own
+    if signatures == set(tables.signature_classes):
+        return "True"
+    for test, predicate in SIGNATURE_TESTS:
+        if all(
+            predicate(signature) == (signature in signatures)
+            for signature in tables.signature_classes
+        ):
+            return test
+    return (
+        "(character.isalpha(), character.isalnum(), character.isdigit(), "
+        f"character.isspace()) in {tuple(sorted(signatures))}"
+    )
+
+
+def findEntryStates(tables: LexerDfaTables):
+    # States reached from more than one place, and states that loop on
+    # themselves, get a block in the dispatch loop, every other state is
+    # inlined at the one place it is reached from
+    entries = {tables.start_state}
+    reached = [0] * len(tables.transitions)
+    for state in range(len(tables.transitions)):
+        characters, signatures = stateBranches(tables, state)
+        for target in set(characters) | set(signatures):
+            if target == state:
+                entries.add(state)
+            elif target >= 0:
+                reached[target] += 1
+    entries.update(state for state, count in enumerate(reached) if count > 1)
+    return entries
+
+
+class LexerSourceWriter:
+    def __init__(self, tables: LexerDfaTables):
+        self.tables = tables
+        self.entries = findEntryStates(tables)
+        self.lines: list[str] = []
+        self.runs: dict[int, str] = {}
+        self.branch_tables: dict[int, dict[str, int]] = {}
+        self.jumps: dict[int, int] = {}
+
+    def emit(self, depth: int, line: str):
+        self.lines.append("    " * depth + line)
+
+    def emitTarget(self, depth: int, state: int, target: int):
+        if target < 0:
+            self.emit(depth, "return longest_end, longest_type, index")
+            return
+        self.emit(depth, "index += 1")
+        accept = self.tables.accepts[target]
+        if accept >= 0:
+            self.emit(depth, "longest_end = index")
+            self.emit(depth, f"longest_type = {accept}")
+        if target == state:
+            self.emit(depth, "continue")
+        elif target in self.entries or depth >= MAX_INLINE_DEPTH:
+            self.entries.add(target)
+            self.jumps[target] = self.jumps.get(target, 0) + 1
+            self.emit(depth, f"state = {target}")
+            self.emit(depth, "break")
+        else:
+            self.emitState(depth, target)
+
+    def emitTests(self, depth: int, state: int, targets, characters, signatures):
+        # The target with the most ASCII characters is left for the else
+        # branch, the others are tested from the fewest characters up
+        targets = sorted(targets, key=lambda target: len(characters.get(target, "")))
+        keyword = "if"
+        for target in targets[:-1]:
+            tests = []
+            if target in characters:
+                target_characters = characters[target]
+                if len(target_characters) == 1:
+                    tests.append(f"character == {target_characters!r}")
+                else:
+                    tests.append(f"character in {target_characters!r}")
+            if target in signatures:
+                test = signatureTest(self.tables, signatures[target])
+                tests.append(f"character >= '\\x80' and {test}")
+            self.emit(depth, f"{keyword} {' or '.join(tests)}:")
+            self.emitTarget(depth + 1, state, target)
+            keyword = "elif"
+        if keyword == "elif":
+            self.emit(depth, "else:")
+            self.emitTarget(depth + 1, state, targets[-1])
+        else:
+            self.emitTarget(depth, state, targets[-1])
+
+    def emitBranchTree(self, depth: int, state: int, targets: list[int], base: int):
+        if len(targets) == 1:
+            self.emitTarget(depth, state, targets[0])
+            return
+        middle = len(targets) // 2
+        self.emit(depth, f"if branch < {base + middle}:")
+        self.emitBranchTree(depth + 1, state, targets[:middle], base)
+        self.emit(depth, "else:")
+        self.emitBranchTree(depth + 1, state, targets[middle:], base + middle)
+
+    def emitState(self, depth: int, state: int):
+        characters, signatures = stateBranches(self.tables, state)
+        if set(characters) | set(signatures) == {-1}:
+            self.emitTarget(depth, state, -1)
+            return
+        self.emit(depth, "character = code[index]")
+        if len(characters) <= MAX_TESTED_TARGETS:
+            targets = set(characters) | set(signatures)
+            self.emitTests(depth, state, targets, characters, signatures)
+            return
+        # States with many targets look the character up in a table of
+        # branch numbers and find the branch by bisection
+        targets = sorted(characters)
+        self.branch_tables[state] = {
+            character: branch
+            for branch, target in enumerate(targets)
+            for character in characters[target]
+        }
+        self.emit(depth, f"branch = branches_{state}.get(character, -1)")
+        self.emit(depth, "if branch < 0:")
+        self.emitTests(
+            depth + 1,
+            state,
+            set(signatures),
+            {},
+            {} if len(signatures) == 1 else signatures,
+        )
+        self.emit(depth, "else:")
+        self.emitBranchTree(depth + 1, state, targets, 0)
+
+    def emitSelfLoop(self, depth: int, state: int):
+        row = self.tables.transitions[state]
+        looping = "".join(
+            chr(point)
+            for point in range(128)
+            if row[self.tables.character_classes[chr(point)]] == state
+        )
+        leaving = "".join(
+            chr(point) for point in range(128) if chr(point) not in looping
+        )
+        # Comment and literal bodies stay in their state for most characters,
+        # their runs are matched by one regex call instead of a test per
+        # character, short runs like identifiers are cheaper tested inline
+        if len(leaving) >= len(looping):
+            return
+        self.runs[state] = "[^" + re.escape(leaving) + "\x80-\U0010ffff]*"
+        self.emit(depth, f"index = run_{state}(code, index).end()")
+        accept = self.tables.accepts[state]
+        if accept >= 0:
+            self.emit(depth, "longest_end = index")
+            self.emit(depth, f"longest_type = {accept}")
+
+    def write(self):
+        start_state = self.tables.start_state
+        blocks: list[list[str]] = []
+        written: set[int] = set()
+        order = [start_state] + sorted(self.entries - {start_state})
+        while order:
+            state = order.pop(0)
+            if state in written:
+                continue
+            written.add(state)
+            self.lines = []
+            self.emit(3, "while True:")
+            self.emitSelfLoop(4, state)
+            self.emitState(4, state)
+            blocks.append((state, self.lines))
+            order.extend(sorted(self.entries - written))
+        # The dispatch tests blocks in order, the most jumped to come first
+        blocks.sort(
+            key=lambda block: (
+                block[0] != start_state,
+                -self.jumps.get(block[0], 0),
+                block[0],
+            )
+        )
+
+        lines = [
+            "# Generated by lexer_codegen.py from the DFA tables, do not edit",
+            "import re",
+            "",
+            f'VERSION = "{generatorVersion()}"',
+        ]
+        for state, pattern in sorted(self.runs.items()):
+            lines.append(f"run_{state} = re.compile({pattern!r}).match")
+        for state, table in sorted(self.branch_tables.items()):
+            lines.append(f"branches_{state} = {table!r}")
+        lines += [
+            "",
+            "",
+            "def scanToken(code, start_index):",
+            "    index = start_index",
+            "    longest_end = -1",
+            "    longest_type = -1",
+            f"    state = {start_state}",
+            "    # Reading past the end of the source is the end of input test",
+            "    try:",
+            "        while True:",
+        ]
+        for block_index, (state, block) in enumerate(blocks):
+            keyword = "if" if block_index == 0 else "elif"
+            lines.append(f"            {keyword} state == {state}:")
+            lines.extend("    " + line for line in block)
+        lines += [
+            "    except IndexError:",
+            "        return longest_end, longest_type, len(code)",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def generateLexerSource(tables: LexerDfaTables):
+    return LexerSourceWriter(tables).write()
+
+
+def readGeneratedVersion(path: str):
+    try:
+        with open(path, "r") as file:
+            file.readline()
+            return file.readline().strip()
+    except OSError:
+        return None
+
+
+def writeGeneratedLexer(path: str = GENERATED_PATH):
+    source = generateLexerSource(lexer_dfa.getDfaTables())
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "w") as file:
+            file.write(source)
+        os.replace(temporary_path, path)
+    except OSError:
+        return source
+    return None
+
+
+generated_scan = None
+
+
+def getGeneratedScan():
+    global generated_scan
+    if generated_scan is None:
+        source = None
+        if readGeneratedVersion(GENERATED_PATH) != f'VERSION = "{generatorVersion()}"':
+            source = writeGeneratedLexer()
+        if source is None:
+            spec = importlib.util.spec_from_file_location(
+                "lexer_generated", GENERATED_PATH
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            generated_scan = module.scanToken
+        else:
+            # A read-only install runs the generated source without saving it
+            namespace: dict = {}
+            exec(compile(source, GENERATED_PATH, "exec"), namespace)
+            generated_scan = namespace["scanToken"]
+    return generated_scan
+
+
+def analyzeSourceGenerated(code: str, tokens: TokenArray | None = None):
+    code_length = len(code)
+    scan = partial(getGeneratedScan(), code)
+    return analyzeScannedSource(
+        code_length, scan, tokens, lexer_dfa.makeInvalidSkip(code)
+    )
+
+
+def main():
+    if writeGeneratedLexer() is not None:
+        print(f"could not write {GENERATED_PATH}")
+        return
+    with open(GENERATED_PATH, "r") as file:
+        line_count = sum(1 for _ in file)
+    print(f"{GENERATED_PATH}: version {generatorVersion()}, {line_count} lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+import re
+
+from lexer_token import TokenArray
+from lexer_types import (
+    LexerDfaTables,
+    LexerTokenTypeAcceptState,
+    LexerTokenTypeState,
+)
+from lexer_driver import analyzeScannedSource
+from lexer_characters import characterClass
+import lexer_tables
+
+
+# Recognizers only look at non-ASCII characters through their character class,
+# which only depends on isalpha, isalnum, isdigit and isspace there, so one
+# representative per signature stands in for all of them.
+NON_ASCII_REPRESENTATIVES = ["\x80", "\x85", "\xaa", "\xb2", "\xbc"]
+PROBE_CHARACTERS = [chr(code) for code in range(128)] + NON_ASCII_REPRESENTATIVES
+
+
+def characterSignature(character: str):
+    return (
+        character.isalpha(),
+        character.isalnum(),
+        character.isdigit(),
+        character.isspace(),
+    )
+
+
+def buildRecognizerTable(recognizer):
+    state_ids = {0: 0}
+    state_names = [0]
+    rows: list[list[tuple[int, bool] | None]] = []
+    while len(rows) < len(state_names):
+        row: list[tuple[int, bool] | None] = []
+        for character in PROBE_CHARACTERS:
+            state = recognizer(
+                LexerTokenTypeState(
+                    LexerTokenTypeAcceptState.IN_PROGRESS,
+                    state_names[len(rows)],
+                    characterClass(character),
+                ),
+                character,
+            )
+            if state.acceptance == LexerTokenTypeAcceptState.REJECTED:
+                row.append(None)
+                continue
+            if state.current_state not in state_ids:
+                state_ids[state.current_state] = len(state_names)
+                state_names.append(state.current_state)
+            row.append(
+                (
+                    state_ids[state.current_state],
+                    state.acceptance == LexerTokenTypeAcceptState.ACCEPTED,
+                )
+            )
+        rows.append(row)
+    return rows
+
+
+def buildProductDfa(recognizer_tables):
+    start = (tuple((type_value, 0) for type_value in range(len(recognizer_tables))), -1)
+    state_ids = {start: 0}
+    states = [start]
+    transitions: list[list[int]] = []
+    while len(transitions) < len(states):
+        components, _ = states[len(transitions)]
+        row = []
+        for probe in range(len(PROBE_CHARACTERS)):
+            next_components = []
+            accept = -1
+            for type_value, local_state in components:
+                step = recognizer_tables[type_value][local_state][probe]
+                if step is None:
+                    continue
+                next_components.append((type_value, step[0]))
+                if step[1]:
+                    accept = type_value
+            if not next_components:
+                row.append(-1)
+                continue
+            next_state = (tuple(next_components), accept)
+            if next_state not in state_ids:
+                state_ids[next_state] = len(states)
+                states.append(next_state)
+            row.append(state_ids[next_state])
+        transitions.append(row)
+    accepts = [accept for _, accept in states]
+    return transitions, accepts
+
+
+def minimizeDfa(transitions: list[list[int]], accepts: list[int]):
+    blocks = [accept for accept in accepts]
+    block_count = len(set(blocks))
+    while True:
+        signatures: dict[tuple, int] = {}
+        next_blocks = []
+        for state, row in enumerate(transitions):
+            signature = (
+                blocks[state],
+                tuple(blocks[target] if target >= 0 else -1 for target in row),
+            )
+            next_blocks.append(signatures.setdefault(signature, len(signatures)))
+        blocks = next_blocks
+        if len(signatures) == block_count:
+            break
+        block_count = len(signatures)
+
+    minimized_transitions: list[list[int]] = [[] for _ in range(block_count)]
+    minimized_accepts = [-1] * block_count
+    for state, row in enumerate(transitions):
+        block = blocks[state]
+        minimized_transitions[block] = [
+            blocks[target] if target >= 0 else -1 for target in row
+        ]
+        minimized_accepts[block] = accepts[state]
+    return minimized_transitions, minimized_accepts, blocks[0]
+
+
+def buildDfaTables():
+    # Importing the recognizers is only needed when the tables are rebuilt
+    from lexer_analyzer import recognizer_list
+
+    recognizer_tables = [buildRecognizerTable(r) for r in recognizer_list]
+    transitions, accepts = buildProductDfa(recognizer_tables)
+    transitions, accepts, start_state = minimizeDfa(transitions, accepts)
+
+    probe_classes: list[int] = []
+    columns: dict[tuple[int, ...], int] = {}
+    for probe in range(len(PROBE_CHARACTERS)):
+        column = tuple(row[probe] for row in transitions)
+        probe_classes.append(columns.setdefault(column, len(columns)))
+
+    class_transitions = []
+    for row in transitions:
+        class_row = [-1] * len(columns)
+        for probe, target in enumerate(row):
+            class_row[probe_classes[probe]] = target
+        class_transitions.append(class_row)
+
+    character_classes = {}
+    signature_classes = {}
+    for probe, character in enumerate(PROBE_CHARACTERS):
+        if ord(character) < 128:
+            character_classes[character] = probe_classes[probe]
+        else:
+            signature_classes[characterSignature(character)] = probe_classes[probe]
+
+    return LexerDfaTables(
+        character_classes=character_classes,
+        signature_classes=signature_classes,
+        transitions=class_transitions,
+        accepts=accepts,
+        start_state=start_state,
+    )
+
+
+class CharacterClassTranslation(dict):
+    def __init__(self, tables: LexerDfaTables):
+        super().__init__(
+            (ord(character), chr(character_class))
+            for character, character_class in tables.character_classes.items()
+        )
+        self.signature_classes = tables.signature_classes
+
+    def __missing__(self, code_point: int):
+        character_class = chr(
+            self.signature_classes[characterSignature(chr(code_point))]
+        )
+        self[code_point] = character_class
+        return character_class
+
+
+def rescanBound(tables: LexerDfaTables):
+    # A scan that reads past its longest accept makes the next scan read those
+    # characters again, this is the most it can read before being rejected, or
+    # None when a loop of non-accepting states makes it unbounded. States that
+    # are only left at the end of the source do not count, the lexer stops there.
+    transitions = tables.transitions
+    accepts = tables.accepts
+    rejecting = [
+        accepts[state] < 0 and -1 in row for state, row in enumerate(transitions)
+    ]
+    changed = True
+    while changed:
+        changed = False
+        for state, row in enumerate(transitions):
+            if accepts[state] < 0 and not rejecting[state]:
+                if any(target >= 0 and rejecting[target] for target in row):
+                    rejecting[state] = True
+                    changed = True
+
+    depths: dict[int, int | None] = {}
+
+    def depth(state: int):
+        if state in depths:
+            return depths[state]
+        depths[state] = None
+        longest = 0
+        for target in transitions[state]:
+            if target >= 0 and rejecting[target]:
+                target_depth = depth(target)
+                if target_depth is None:
+                    return None
+                longest = max(longest, target_depth + 1)
+        depths[state] = longest
+        return longest
+
+    bound = 0
+    for state, row in enumerate(transitions):
+        if accepts[state] < 0:
+            continue
+        for target in row:
+            if target >= 0 and rejecting[target]:
+                target_depth = depth(target)
+                if target_depth is None:
+                    return None
+                bound = max(bound, target_depth + 1)
+    return bound
+
+
+dfa_tables: LexerDfaTables | None = None
+dfa_translation: CharacterClassTranslation | None = None
+dfa_rescan_bound: int | None = None
+
+
+def getDfaTables():
+    global dfa_tables, dfa_translation, dfa_rescan_bound
+    if dfa_tables is None:
+        dfa_tables = lexer_tables.loadDfaTables()
+        if dfa_tables is None:
+            dfa_tables = buildDfaTables()
+            lexer_tables.saveDfaTables(dfa_tables)
+        dfa_translation = CharacterClassTranslation(dfa_tables)
+        dfa_rescan_bound = rescanBound(dfa_tables)
+    return dfa_tables
+
+
+def classifySource(code: str) -> bytes:
+    getDfaTables()
+    return code.translate(dfa_translation).encode("latin-1")
+
+
+invalid_run: re.Pattern | None = None
+
+
+def getInvalidRunPattern():
+    global invalid_run
+    if invalid_run is None:
+        tables = getDfaTables()
+        dead_classes = bytes(
+            character_class
+            for character_class, target in enumerate(
+                tables.transitions[tables.start_state]
+            )
+            if target < 0
+        )
+        invalid_run = re.compile(b"[" + re.escape(dead_classes) + b"]*")
+    return invalid_run
+
+
+def makeClassifiedInvalidSkip(classes: bytes):
+    match = getInvalidRunPattern().match
+
+    def skip(start_index: int):
+        return match(classes, start_index).end()
+
+    return skip
+
+
+def makeInvalidSkip(code: str):
+    skip = None
+
+    # The source is only classified once an INVALID run is actually skipped
+    def lazySkip(start_index: int):
+        nonlocal skip
+        if skip is None:
+            skip = makeClassifiedInvalidSkip(classifySource(code))
+        return skip(start_index)
+
+    return lazySkip
+
+
+def makeClassifiedScan(classes: bytes):
+    tables = getDfaTables()
+    transitions = tables.transitions
+    accepts = tables.accepts
+    start_state = tables.start_state
+    code_length = len(classes)
+
+    def scan(start_index: int):
+        state = start_state
+        longest_end = -1
+        longest_type = -1
+        index = start_index
+        while index < code_length:
+            state = transitions[state][classes[index]]
+            if state < 0:
+                return longest_end, longest_type, index
+            index += 1
+            if accepts[state] >= 0:
+                longest_end = index
+                longest_type = accepts[state]
+        return longest_end, longest_type, code_length
+
+    if dfa_rescan_bound is not None:
+        return scan
+
+    # Without a bound, every (state, index) pair read after the longest accept
+    # is remembered with the index the scan stopped at, so a later scan that
+    # reaches the same pair stops there and each pair is only read once
+    failed: dict[tuple[int, int], int] = {}
+
+    def memoizedScan(start_index: int):
+        state = start_state
+        longest_end = -1
+        longest_type = -1
+        index = start_index
+        pending: list[tuple[int, int]] = []
+        while index < code_length:
+            state = transitions[state][classes[index]]
+            if state < 0:
+                break
+            index += 1
+            if accepts[state] >= 0:
+                longest_end = index
+                longest_type = accepts[state]
+                pending.clear()
+                continue
+            stop_index = failed.get((state, index))
+            if stop_index is not None:
+                index = stop_index
+                break
+            pending.append((state, index))
+        for pair in pending:
+            failed[pair] = index
+        return longest_end, longest_type, index
+
+    return memoizedScan
+
+
+def analyzeClassifiedSource(classes: bytes, tokens: TokenArray | None = None):
+    scan = makeClassifiedScan(classes)
+    code_length = len(classes)
+    return analyzeScannedSource(
+        code_length, scan, tokens, makeClassifiedInvalidSkip(classes)
+    )
+
+
+def analyzeSourceDfa(code: str, tokens: TokenArray | None = None):
+    return analyzeClassifiedSource(classifySource(code), tokens)
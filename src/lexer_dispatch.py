@@ -0,0 +1,97 @@
+from lexer_token import TokenArray
+from lexer_types import LexerTokenTypeAcceptState, LexerTokenTypeState
+from lexer_analyzer import recognizer_list, analyzeScannedSource
+from lexer_dfa import PROBE_CHARACTERS, characterSignature, makeInvalidSkip
+from lexer_characters import characterClass
+
+
+class DispatchIndex:
+    def __init__(self, type_values: list[int]):
+        self.character_dispatch: dict[str, tuple[int, ...]] = {}
+        self.signature_dispatch: dict[
+            tuple[bool, bool, bool, bool], tuple[int, ...]
+        ] = {}
+        for character in PROBE_CHARACTERS:
+            starters = []
+            for type_value in type_values:
+                state = recognizer_list[type_value](
+                    LexerTokenTypeState(
+                        LexerTokenTypeAcceptState.IN_PROGRESS,
+                        character_class=characterClass(character),
+                    ),
+                    character,
+                )
+                if state.acceptance != LexerTokenTypeAcceptState.REJECTED:
+                    starters.append(type_value)
+            if ord(character) < 128:
+                self.character_dispatch[character] = tuple(starters)
+            else:
+                self.signature_dispatch[characterSignature(character)] = tuple(starters)
+
+    def startingRecognizers(self, character: str):
+        starters = self.character_dispatch.get(character)
+        if starters is None:
+            starters = self.signature_dispatch[characterSignature(character)]
+            self.character_dispatch[character] = starters
+        return starters
+
+
+def makeDispatchScan(code: str, dispatch: DispatchIndex):
+    code_length = len(code)
+    recognizers = recognizer_list
+    REJECTED = LexerTokenTypeAcceptState.REJECTED
+    ACCEPTED = LexerTokenTypeAcceptState.ACCEPTED
+    IN_PROGRESS = LexerTokenTypeAcceptState.IN_PROGRESS
+
+    def scan(start_index: int):
+        live = [
+            (type_value, LexerTokenTypeState(IN_PROGRESS))
+            for type_value in dispatch.startingRecognizers(code[start_index])
+        ]
+        longest_end = -1
+        longest_type = -1
+        index = start_index
+        while live:
+            if index == code_length:
+                return longest_end, longest_type, code_length
+            character = code[index]
+            character_class = characterClass(character)
+            still_live = []
+            accepted_type = -1
+            for type_value, state in live:
+                state.character_class = character_class
+                state = recognizers[type_value](state, character)
+                if state.acceptance == REJECTED:
+                    continue
+                if state.acceptance == ACCEPTED:
+                    accepted_type = type_value
+                still_live.append((type_value, state))
+            live = still_live
+            if not live:
+                break
+            index += 1
+            if accepted_type >= 0:
+                longest_end = index
+                longest_type = accepted_type
+        return longest_end, longest_type, index
+
+    return scan
+
+
+dispatch_index: DispatchIndex | None = None
+
+
+def getDispatchIndex():
+    global dispatch_index
+    if dispatch_index is None:
+        dispatch_index = DispatchIndex(list(range(len(recognizer_list))))
+    return dispatch_index
+
+
+def analyzeSourceDispatch(code: str, tokens: TokenArray | None = None):
+    return analyzeScannedSource(
+        len(code),
+        makeDispatchScan(code, getDispatchIndex()),
+        tokens,
+        makeInvalidSkip(code),
+    )
@@ -0,0 +1,43 @@
+from lexer_token import TokenType, Token, TokenArray, token_types
+
+
+def analyzeScannedSource(
+    code_length: int, scan, tokens: TokenArray | None = None, skip=None
+):
+    if tokens is None:
+        token_list: list[Token] = []
+
+        def emit(type_value: int, start: int, end: int):
+            token_list.append(Token(token_types[type_value], start, end))
+
+    else:
+        emit = tokens.appendToken
+    # Characters no token can start with are skipped in one step when the
+    # output merges INVALID runs anyway
+    if tokens is None or not tokens.coalesce_invalid:
+        skip = None
+    invalid = TokenType.INVALID.value
+    start_index = 0
+    while start_index < code_length:
+        longest_end, longest_type, stop_index = scan(start_index)
+        if stop_index == code_length:
+            # Input ran out while a recognizer was still in progress
+            if longest_end == -1:
+                emit(invalid, start_index, code_length)
+            else:
+                emit(longest_type, start_index, longest_end)
+            break
+        if longest_end == -1:
+            invalid_start = start_index if start_index == stop_index else stop_index
+            invalid_end = invalid_start + 1
+            if skip is not None:
+                invalid_end = skip(invalid_end)
+            emit(invalid, invalid_start, invalid_end)
+            start_index = invalid_end
+            continue
+        emit(longest_type, start_index, longest_end)
+        start_index = longest_end
+
+    emit(TokenType.ENDMARKER.value, code_length, code_length)
+
+    return token_list if tokens is None else tokens
@@ -0,0 +1,144 @@
+import json
+
+from lexer_mmap import normalizeNewlines
+from lexer_stream import StreamingLexer
+from lexer_token import Token
+from lexer_tokenfile import saveTokenFile
+
+
+EXPORT_FORMATS = ["json", "ndjson", "binary"]
+CHUNK_SIZE = 1 << 14
+
+
+class SourceWindow:
+    # The part of a streamed source that tokens still refer to, sliced with
+    # offsets into the whole source like the source string itself
+    def __init__(self):
+        self.text = ""
+        self.offset = 0
+        # Chunks are only joined once a slice reaches into them, so a token
+        # spanning many chunks is joined once instead of once per chunk
+        self.chunks: list[str] = []
+
+    def join(self):
+        self.text += "".join(self.chunks)
+        self.chunks.clear()
+
+    def append(self, chunk: str):
+        self.chunks.append(chunk)
+
+    def discard(self, offset: int):
+        if offset - self.offset > len(self.text):
+            self.join()
+        self.text = self.text[offset - self.offset :]
+        self.offset = offset
+
+    def __getitem__(self, index: slice):
+        if index.stop - self.offset > len(self.text) and self.chunks:
+            self.join()
+        return self.text[index.start - self.offset : index.stop - self.offset]
+
+
+def advanceLines(text: str, offset: int, line: int, line_start: int):
+    newlines = text.count("\n")
+    if newlines:
+        return line + newlines, offset + text.rfind("\n") + 1
+    return line, line_start
+
+
+def streamTokens(file, window: SourceWindow, chunk_size: int = CHUNK_SIZE):
+    # Tokens with their positions, lexed chunk by chunk from a text file with
+    # newlines normalized as for the whole source, only the text after the
+    # last token stays in the window
+    lexer = StreamingLexer()
+    position = 0
+    line = 1
+    line_start = 0
+    pending = ""
+    while not lexer.closed:
+        chunk = file.read(chunk_size)
+        if chunk:
+            chunk = pending + chunk
+            # A newline run at the end of a chunk may continue in the next one
+            kept = len(chunk.rstrip("\r\n"))
+            pending = chunk[kept:]
+            chunk = normalizeNewlines(chunk[:kept])
+            window.append(chunk)
+            tokens = lexer.feed(chunk)
+        else:
+            chunk = normalizeNewlines(pending)
+            window.append(chunk)
+            tokens = lexer.feed(chunk) + lexer.close()
+        for token in tokens:
+            line, line_start = advanceLines(
+                window[position : token.start], position, line, line_start
+            )
+            start_line = line
+            start_column = token.start - line_start + 1
+            line, line_start = advanceLines(
+                window[token.start : token.end], token.start, line, line_start
+            )
+            position = token.end
+            yield Token(
+                token.type,
+                token.start,
+                token.end,
+                start_line,
+                start_column,
+                line,
+                token.end - line_start + 1,
+            )
+        window.discard(position)
+
+
+def tokenRecord(token, code: str):
+    return {
+        "type": token.type.name,
+        "start": int(token.start),
+        "end": int(token.end),
+        "start_line": token.line,
+        "start_col": token.column,
+        "end_line": token.end_line,
+        "end_col": token.end_column,
+        "lexeme": code[token.start : token.end],
+    }
+
+
+def writeTokensJson(tokens, code: str, file):
+    # Each token is written in the layout json.dump(indent=2) gives the whole
+    # list, so the list of records never exists at once
+    encode = json.JSONEncoder(indent=2).encode
+    separator = "[\n  "
+    for token in tokens:
+        file.write(separator)
+        file.write(encode(tokenRecord(token, code)).replace("\n", "\n  "))
+        separator = ",\n  "
+    file.write("[]" if separator == "[\n  " else "\n]")
+
+
+def writeTokensNdjson(tokens, code: str, file):
+    encode = json.JSONEncoder().encode
+    for token in tokens:
+        file.write(encode(tokenRecord(token, code)))
+        file.write("\n")
+
+
+def writeTokens(
+    tokens, code: str | SourceWindow, path: str, export_format: str = "json"
+):
+    # Tokens need their line and column, see analyzeSource(positions=True)
+    if export_format == "binary":
+        saveTokenFile(path, tokens, code)
+    elif export_format == "ndjson":
+        with open(path, "w") as file:
+            writeTokensNdjson(tokens, code, file)
+    elif export_format == "json":
+        with open(path, "w") as file:
+            writeTokensJson(tokens, code, file)
+    else:
+        raise ValueError(f"Unknown export format {export_format}")
+
+
+def dumpTokens(file, path: str, export_format: str = "json"):
+    window = SourceWindow()
+    writeTokens(streamTokens(file, window), window, path, export_format)
@@ -0,0 +1,172 @@
+from array import array
+from bisect import bisect_left
+
+from lexer_token import Token, TokenArray, TokenType, token_types
+from lexer_types import LexerEdit
+import lexer_dfa
+
+
+class IncrementalTokens:
+    def __init__(self, tokens: list[Token] | TokenArray):
+        # The ENDMARKER is kept apart, the columns only hold the body
+        self.tokens = TokenArray()
+        for index in range(len(tokens) - 1):
+            self.tokens.append(tokens[index])
+        self.code_length = tokens[-1].end
+        # Tokens from shift_index on are stored shift characters before their
+        # real offsets, so an edit only moves the tail by changing shift. The
+        # shift is applied to the tokens between the old and the new edit
+        # position when the next edit lands elsewhere, like the gap of a gap
+        # buffer.
+        self.shift_index = len(self.tokens)
+        self.shift = 0
+
+    def __len__(self):
+        return len(self.tokens) + 1
+
+    def __getitem__(self, index: int) -> Token:
+        if index < 0:
+            index += len(self)
+        if index == len(self.tokens):
+            return Token(TokenType.ENDMARKER, self.code_length, self.code_length)
+        if not 0 <= index < len(self.tokens):
+            raise IndexError("token index out of range")
+        shift = self.shift if index >= self.shift_index else 0
+        return Token(
+            token_types[self.tokens.types[index]],
+            self.tokens.starts[index] + shift,
+            self.tokens.ends[index] + shift,
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def toList(self) -> list[Token]:
+        return list(self)
+
+    def realEnd(self, index: int):
+        if index >= self.shift_index:
+            return self.tokens.ends[index] + self.shift
+        return self.tokens.ends[index]
+
+    def findEnd(self, offset: int, lo: int = 0):
+        # First body token ending at or after offset, the stored ends are
+        # sorted on both sides of the shift index
+        ends = self.tokens.ends
+        shift_index = self.shift_index
+        if lo < shift_index and ends[shift_index - 1] >= offset:
+            return bisect_left(ends, offset, lo, shift_index)
+        return bisect_left(ends, offset - self.shift, max(lo, shift_index))
+
+    def moveShift(self, index: int):
+        if self.shift:
+            low, high = sorted([index, self.shift_index])
+            shift = self.shift if index > self.shift_index else -self.shift
+            for column in [self.tokens.starts, self.tokens.ends]:
+                column[low:high] = array(
+                    "q", [offset + shift for offset in column[low:high]]
+                )
+        self.shift_index = index
+
+    def splice(self, start: int, stop: int, relexed: TokenArray):
+        self.tokens.types[start:stop] = relexed.types
+        self.tokens.starts[start:stop] = relexed.starts
+        self.tokens.ends[start:stop] = relexed.ends
+
+    def relex(self, edit: LexerEdit, code: str):
+        tables = lexer_dfa.getDfaTables()
+        transitions = tables.transitions
+        accepts = tables.accepts
+        start_state = tables.start_state
+        translation = lexer_dfa.dfa_translation
+        code_length = len(code)
+        delta = len(edit.replacement) - (edit.end - edit.start)
+        edit_end = edit.start + len(edit.replacement)
+        body_length = len(self.tokens)
+
+        # Only the text around the edit is classified, so the work does not
+        # depend on the size of the source
+        def scan(start_index: int):
+            state = start_state
+            longest_end = -1
+            longest_type = -1
+            index = start_index
+            while index < code_length:
+                state = transitions[state][ord(translation[ord(code[index])])]
+                if state < 0:
+                    return longest_end, longest_type, index
+                index += 1
+                if accepts[state] >= 0:
+                    longest_end = index
+                    longest_type = accepts[state]
+            return longest_end, longest_type, code_length
+
+        def resumeIndex(token_index: int):
+            return self.realEnd(token_index - 1) if token_index > 0 else 0
+
+        # Tokens before the edit are kept unless their scan looked past the
+        # edit start, every token is scanned from the end of the one before it
+        first_changed = self.findEnd(edit.start)
+        while first_changed > 0:
+            _, _, stop_index = scan(resumeIndex(first_changed - 1))
+            if stop_index < edit.start:
+                break
+            first_changed -= 1
+
+        relexed = TokenArray()
+        start_index = resumeIndex(first_changed)
+        while start_index < code_length:
+            if start_index >= edit_end:
+                old_index = self.findEnd(start_index - delta, first_changed)
+                # The last token does not resume the old lexing when it was
+                # cut off by the end of the old source
+                resumed = old_index < body_length - 1 or (
+                    old_index == body_length - 1
+                    and self.realEnd(old_index) == self.code_length
+                )
+                if resumed and self.realEnd(old_index) == start_index - delta:
+                    # The old tail stays where it is, only its shift changes
+                    self.moveShift(old_index + 1)
+                    self.splice(first_changed, old_index + 1, relexed)
+                    self.shift_index = first_changed + len(relexed)
+                    self.shift += delta
+                    self.code_length = code_length
+                    return self
+            longest_end, longest_type, stop_index = scan(start_index)
+            if stop_index == code_length:
+                if longest_end == -1:
+                    relexed.appendToken(
+                        TokenType.INVALID.value, start_index, code_length
+                    )
+                else:
+                    relexed.appendToken(longest_type, start_index, longest_end)
+                break
+            if longest_end == -1:
+                invalid_start = start_index if start_index == stop_index else stop_index
+                relexed.appendToken(
+                    TokenType.INVALID.value, invalid_start, invalid_start + 1
+                )
+                start_index = invalid_start + 1
+                continue
+            relexed.appendToken(longest_type, start_index, longest_end)
+            start_index = longest_end
+
+        # Dropped tokens never need their shift applied
+        if self.shift_index < first_changed:
+            self.moveShift(first_changed)
+        self.splice(first_changed, body_length, relexed)
+        self.shift_index = len(self.tokens)
+        self.shift = 0
+        self.code_length = code_length
+        return self
+
+
+def relexEdit(
+    tokens: list[Token] | TokenArray | IncrementalTokens, edit: LexerEdit, code: str
+) -> IncrementalTokens:
+    # Plain token lists are converted once, the returned IncrementalTokens is
+    # edited in place by later calls so their cost stays local to the edit
+    if not isinstance(tokens, IncrementalTokens):
+        tokens = IncrementalTokens(tokens)
+    return tokens.relex(edit, code)
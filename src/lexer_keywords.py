@@ -0,0 +1,104 @@
+import re
+
+from lexer_token import TokenType, TokenArray
+from lexer_types import LexerTokenTypeAcceptState, LexerTokenTypeState
+from lexer_analyzer import recognizer_list, analyzeScannedSource
+from lexer_dfa import PROBE_CHARACTERS, buildRecognizerTable, makeInvalidSkip
+from lexer_dispatch import DispatchIndex, makeDispatchScan
+from lexer_characters import characterClass
+
+
+identifier_tail = re.compile(r"\w*")
+
+
+def recognizerWords(recognizer) -> list[str] | None:
+    table = buildRecognizerTable(recognizer)
+    words: list[str] = []
+
+    def visit(local_state: int, prefix: str, path: tuple[int, ...]):
+        for probe, step in enumerate(table[local_state]):
+            if step is None:
+                continue
+            character = PROBE_CHARACTERS[probe]
+            next_state, accepted = step
+            # Non-ASCII steps stand for whole character classes and cycles
+            # accept unbounded input, neither is a fixed spelling
+            if ord(character) >= 128 or next_state in path:
+                return False
+            if accepted:
+                words.append(prefix + character)
+            if not visit(next_state, prefix + character, path + (next_state,)):
+                return False
+        return True
+
+    if not visit(0, "", (0,)):
+        return None
+    return words
+
+
+def isIdentifierWord(word: str):
+    state = LexerTokenTypeState(LexerTokenTypeAcceptState.IN_PROGRESS)
+    for character in word:
+        state.character_class = characterClass(character)
+        state = recognizer_list[TokenType.IDENTIFIER.value](state, character)
+        if state.acceptance == LexerTokenTypeAcceptState.REJECTED:
+            return False
+    return state.acceptance == LexerTokenTypeAcceptState.ACCEPTED
+
+
+def buildKeywordTable():
+    keywords: dict[str, int] = {}
+    keyword_types: set[int] = set()
+    for type_value, recognizer in enumerate(recognizer_list):
+        if type_value == TokenType.IDENTIFIER.value:
+            continue
+        words = recognizerWords(recognizer)
+        if not words or not all(isIdentifierWord(word) for word in words):
+            continue
+        keyword_types.add(type_value)
+        for word in words:
+            keywords[word] = max(keywords.get(word, -1), type_value)
+    return keywords, keyword_types
+
+
+class KeywordLexer:
+    def __init__(self):
+        self.keywords, self.keyword_types = buildKeywordTable()
+        self.dispatch = DispatchIndex(
+            [
+                type_value
+                for type_value in range(len(recognizer_list))
+                if type_value not in self.keyword_types
+            ]
+        )
+        self.identifier_only = (TokenType.IDENTIFIER.value,)
+
+
+keyword_lexer: KeywordLexer | None = None
+
+
+def getKeywordLexer():
+    global keyword_lexer
+    if keyword_lexer is None:
+        keyword_lexer = KeywordLexer()
+    return keyword_lexer
+
+
+def analyzeSourceKeywords(code: str, tokens: TokenArray | None = None):
+    lexer = getKeywordLexer()
+    keywords = lexer.keywords
+    starting_recognizers = lexer.dispatch.startingRecognizers
+    identifier_only = lexer.identifier_only
+    identifier = TokenType.IDENTIFIER.value
+    dispatch_scan = makeDispatchScan(code, lexer.dispatch)
+
+    def scan(start_index: int):
+        if starting_recognizers(code[start_index]) == identifier_only:
+            end = identifier_tail.match(code, start_index + 1).end()
+            return end, keywords.get(code[start_index:end], identifier), end
+        longest_end, longest_type, stop_index = dispatch_scan(start_index)
+        if longest_type == identifier:
+            longest_type = keywords.get(code[start_index:longest_end], identifier)
+        return longest_end, longest_type, stop_index
+
+    return analyzeScannedSource(len(code), scan, tokens, makeInvalidSkip(code))
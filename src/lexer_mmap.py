@@ -0,0 +1,93 @@
+import codecs
+import mmap
+import re
+
+from lexer_token import TokenArray
+import lexer_dfa
+
+
+BLOCK_SIZE = 1 << 20
+
+# Newline runs still holding a carriage return once "\r\n" has been replaced
+newline_run = re.compile(r"[\r\n]*\r[\r\n]*")
+newline_run_bytes = re.compile(rb"[\r\n]*\r[\r\n]*")
+
+
+def normalizeRun(run, carriage, newline):
+    return run.replace(newline + carriage, newline).replace(carriage, newline)
+
+
+# Same result as replacing "\r\n", then "\n\r", then "\r" with "\n", but
+# without copying text that holds no carriage return
+def normalizeNewlines(code: str) -> str:
+    if "\r" not in code:
+        return code
+    code = code.replace("\r\n", "\n")
+    if "\r" not in code:
+        return code
+    return newline_run.sub(lambda match: normalizeRun(match.group(), "\r", "\n"), code)
+
+
+def normalizeNewlinesBytes(data: bytes) -> bytes:
+    if b"\r" not in data:
+        return data
+    data = data.replace(b"\r\n", b"\n")
+    if b"\r" not in data:
+        return data
+    return newline_run_bytes.sub(
+        lambda match: normalizeRun(match.group(), b"\r", b"\n"), data
+    )
+
+
+def asciiClassTable() -> bytes:
+    tables = lexer_dfa.getDfaTables()
+    return bytes(
+        tables.character_classes[chr(code)] if code < 128 else 0 for code in range(256)
+    )
+
+
+def classifyBlocks(blocks) -> bytearray:
+    ascii_classes = asciiClassTable()
+    translation = lexer_dfa.dfa_translation
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    classes = bytearray()
+    pending = b""
+    for block in blocks:
+        block = pending + block
+        # A newline run at the end of a block may continue in the next one
+        kept = len(block.rstrip(b"\r\n"))
+        pending = block[kept:]
+        block = normalizeNewlinesBytes(block[:kept])
+        if block.isascii() and not decoder.getstate()[0]:
+            classes += block.translate(ascii_classes)
+        else:
+            # Offsets count code points, so only non-ASCII blocks are decoded
+            text = decoder.decode(block)
+            classes += text.translate(translation).encode("latin-1")
+    classes += normalizeNewlinesBytes(pending).translate(ascii_classes)
+    decoder.decode(b"", final=True)
+    return classes
+
+
+def classifyFile(path: str, block_size: int = BLOCK_SIZE) -> bytearray:
+    with open(path, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return bytearray()
+        with mapped:
+            view = memoryview(mapped)
+            try:
+                return classifyBlocks(
+                    bytes(view[offset : offset + block_size])
+                    for offset in range(0, len(view), block_size)
+                )
+            finally:
+                view.release()
+
+
+def analyzeFile(
+    path: str, tokens: TokenArray | None = None, block_size: int = BLOCK_SIZE
+):
+    return lexer_dfa.analyzeClassifiedSource(classifyFile(path, block_size), tokens)
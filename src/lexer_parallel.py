@@ -0,0 +1,154 @@
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer_token import TokenArray, TokenType
+import lexer_dfa
+
+
+MIN_CHUNK_SIZE = 1 << 18
+
+# String and char literals are matched too, so a "/*" inside them is skipped
+comment_or_literal = re.compile(
+    r'"(?:[^"\\\n]|\\[^\n])*"'
+    r"|'(?:[^'\\\n]|\\[^\n])*'"
+    r"|//[^\n]*"
+    r"|/\*.*?(?:\*/|\Z)",
+    re.DOTALL,
+)
+
+
+def findSplitPoints(code: str, chunk_size: int):
+    comment_starts: list[int] = []
+    comment_ends: list[int] = []
+    for match in comment_or_literal.finditer(code):
+        if code.find("\n", match.start(), match.end()) != -1:
+            comment_starts.append(match.start())
+            comment_ends.append(match.end())
+
+    points = [0]
+    target = chunk_size
+    while target < len(code):
+        newline = code.find("\n", target)
+        if newline == -1 or newline + 1 >= len(code):
+            break
+        comment_index = bisect_right(comment_starts, newline) - 1
+        if comment_index >= 0 and comment_ends[comment_index] > newline:
+            target = comment_ends[comment_index]
+            continue
+        points.append(newline + 1)
+        target = newline + 1 + chunk_size
+    points.append(len(code))
+    return points
+
+
+def lexChunk(chunk: str, offset: int):
+    tokens = lexer_dfa.analyzeSourceDfa(chunk, TokenArray())
+    # The chunk's own end marker is dropped
+    count = len(tokens) - 1
+    return (
+        tokens.types[:count].tobytes(),
+        array("q", [start + offset for start in tokens.starts[:count]]).tobytes(),
+        array("q", [end + offset for end in tokens.ends[:count]]).tobytes(),
+    )
+
+
+def analyzeSourceParallel(
+    code: str,
+    tokens: TokenArray | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+):
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(code) // workers))
+    points = findSplitPoints(code, chunk_size)
+    if len(points) <= 2:
+        return lexer_dfa.analyzeSourceDfa(code, tokens)
+
+    tables = lexer_dfa.getDfaTables()
+    transitions = tables.transitions
+    accepts = tables.accepts
+    start_state = tables.start_state
+    translation = lexer_dfa.dfa_translation
+    code_length = len(code)
+    output = TokenArray() if tokens is None else tokens
+    emit = output.appendToken
+    invalid = TokenType.INVALID.value
+
+    def scan(start_index: int):
+        state = start_state
+        longest_end = -1
+        longest_type = -1
+        index = start_index
+        while index < code_length:
+            state = transitions[state][ord(translation[ord(code[index])])]
+            if state < 0:
+                return longest_end, longest_type, index
+            index += 1
+            if accepts[state] >= 0:
+                longest_end = index
+                longest_type = accepts[state]
+        return longest_end, longest_type, code_length
+
+    # Lexes one token the way analyzeScannedSource does, returns the resume
+    # point or None once the input ran out
+    def step(start_index: int):
+        longest_end, longest_type, stop_index = scan(start_index)
+        if stop_index == code_length:
+            if longest_end == -1:
+                emit(invalid, start_index, code_length)
+            else:
+                emit(longest_type, start_index, longest_end)
+            return None
+        if longest_end == -1:
+            invalid_start = start_index if start_index == stop_index else stop_index
+            emit(invalid, invalid_start, invalid_start + 1)
+            return invalid_start + 1
+        emit(longest_type, start_index, longest_end)
+        return longest_end
+
+    position = 0
+    with ProcessPoolExecutor(workers) as executor:
+        results = executor.map(
+            lexChunk,
+            (code[start:end] for start, end in zip(points, points[1:])),
+            points[:-1],
+        )
+        for chunk_start, (type_bytes, start_bytes, end_bytes) in zip(points, results):
+            if position is None:
+                break
+            types = array("B", type_bytes)
+            starts = array("q", start_bytes)
+            ends = array("q", end_bytes)
+            # Only the last token of a chunk can depend on text past the chunk
+            # end, every earlier token ended where the chunk's lexing resumed
+            reliable = len(types) - 1
+            last_resume = ends[reliable - 1] if reliable > 0 else chunk_start
+            while position is not None and position <= last_resume:
+                if position == chunk_start:
+                    first = 0
+                else:
+                    first = bisect_left(ends, position, 0, reliable) + 1
+                    if first > reliable or ends[first - 1] != position:
+                        # Repair tokens that cross the split point serially
+                        # until both lexings resume at the same offset
+                        position = step(position)
+                        continue
+                output.extend(
+                    TokenArray(
+                        types[first:reliable],
+                        starts[first:reliable],
+                        ends[first:reliable],
+                    )
+                )
+                position = last_resume
+                break
+
+    while position is not None and position < code_length:
+        position = step(position)
+    emit(TokenType.ENDMARKER.value, code_length, code_length)
+
+    return output.toList() if tokens is None else output
@@ -0,0 +1,171 @@
+import argparse
+import random
+import sys
+
+from lexer_analyzer import analyzeSource
+from lexer_parallel import analyzeSourceParallel
+from lexer_types import LexerMode
+
+
+FRAGMENTS = [
+    "int",
+    "integer",
+    "km",
+    "km2",
+    "kmx",
+    "auto",
+    "autom",
+    "automatic",
+    "celc",
+    "mps2",
+    "meter2",
+    "string",
+    "str",
+    "x_1",
+    "_",
+    "é",
+    "ª",
+    "²",
+    "¼",
+    "一",
+    "€",
+    "0",
+    "00",
+    "-0",
+    "0-5",
+    "12",
+    "1.5",
+    ".5",
+    "1.",
+    "-.",
+    "-",
+    "'a'",
+    "'\\''",
+    "'ab",
+    '"s"',
+    '"s\\"t"',
+    '"open',
+    "\\",
+    "//c\n",
+    "/*a*/",
+    "/**/",
+    "/*x",
+    "/",
+    "*",
+    "%",
+    "^",
+    "+",
+    "++",
+    "+=",
+    "+%",
+    "--",
+    "-=",
+    "-%",
+    "*=",
+    "*%",
+    "/=",
+    "%=",
+    "<",
+    "<=",
+    ">",
+    ">=",
+    "!",
+    "!=",
+    "=",
+    "==",
+    "&",
+    "&&",
+    "|",
+    "||",
+    ",",
+    ";",
+    ":",
+    "(",
+    ")",
+    "[",
+    "]",
+    "{",
+    "}",
+    "@",
+    "$",
+    "?",
+    " ",
+    "\t",
+    "\n",
+    "\x85",
+    "　",
+]
+
+
+def generateSources(count: int, seed: int = 0):
+    generator = random.Random(seed)
+    for _ in range(count):
+        yield "".join(
+            generator.choice(FRAGMENTS) + generator.choice(["", "", " "])
+            for _ in range(generator.randint(0, 30))
+        )
+
+
+# The random sources are far below MIN_CHUNK_SIZE, tiny chunks make the
+# parallel engine split them and exercise its stitching and repair
+PARALLEL_WORKERS = 2
+PARALLEL_CHUNK_SIZE = 1
+
+
+def lexMode(code: str, mode: LexerMode):
+    if mode == LexerMode.PARALLEL:
+        return analyzeSourceParallel(code, None, PARALLEL_WORKERS, PARALLEL_CHUNK_SIZE)
+    return analyzeSource(code, mode)
+
+
+def findMismatch(expected: list, actual: list):
+    for index in range(max(len(expected), len(actual))):
+        expected_token = expected[index] if index < len(expected) else None
+        actual_token = actual[index] if index < len(actual) else None
+        if expected_token != actual_token:
+            return index, expected_token, actual_token
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the lexer engines against the recognizer engine"
+    )
+    parser.add_argument("files", nargs="*", help="sources instead of random ones")
+    parser.add_argument("--modes", nargs="*", default=None, help="e.g. DFA REGEX")
+    parser.add_argument("--count", type=int, default=500, help="random sources")
+    args = parser.parse_args()
+
+    modes = [mode for mode in LexerMode if mode != LexerMode.RECOGNIZER]
+    if args.modes:
+        modes = [LexerMode[name] for name in args.modes]
+    if args.files:
+        corpus = []
+        for path in args.files:
+            with open(path, "r") as file:
+                corpus.append(file.read())
+    else:
+        corpus = list(generateSources(args.count))
+
+    mismatches = {mode: 0 for mode in modes}
+    for code in corpus:
+        expected = analyzeSource(code, LexerMode.RECOGNIZER)
+        for mode in modes:
+            mismatch = findMismatch(expected, lexMode(code, mode))
+            if mismatch is None:
+                continue
+            if mismatches[mode] == 0:
+                index, expected_token, actual_token = mismatch
+                print(f"{mode.name}: {code!r}")
+                print(f"  token {index}: expected {expected_token}, got {actual_token}")
+            mismatches[mode] += 1
+
+    for mode in modes:
+        print(
+            f"{mode.name}: {len(corpus) - mismatches[mode]}/{len(corpus)} sources match"
+        )
+    sys.exit(1 if any(mismatches.values()) else 0)
+
+
+if __name__ == "__main__":
+    main()
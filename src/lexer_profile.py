@@ -0,0 +1,76 @@
+import argparse
+import json
+import time
+
+from lexer_analyzer import analyzeSource
+from lexer_token import TokenType
+from lexer_types import LexerMode, LexerProfile
+
+
+def profileRows(profile: LexerProfile):
+    total_invocations = max(sum(profile.invocations), 1)
+    rows = []
+    for type_value, invocations in enumerate(profile.invocations):
+        rows.append(
+            {
+                "token_type": TokenType(type_value).name,
+                "invocations": invocations,
+                "invocation_share": invocations / total_invocations,
+                "live_characters": profile.live_characters[type_value],
+                "wins": profile.wins[type_value],
+            }
+        )
+    rows.sort(key=lambda row: row["invocations"], reverse=True)
+    return rows
+
+
+def formatProfile(profile: LexerProfile):
+    lines = [
+        f"{'token type':<26} {'invocations':>12} {'share':>7} "
+        f"{'live chars':>11} {'wins':>9}"
+    ]
+    for row in profileRows(profile):
+        lines.append(
+            f"{row['token_type']:<26} {row['invocations']:>12} "
+            f"{row['invocation_share']:>7.1%} {row['live_characters']:>11} "
+            f"{row['wins']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Count recognizer invocations, live characters and wins"
+    )
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--output", default=None, help="JSON results file")
+    args = parser.parse_args()
+
+    profile = LexerProfile()
+    characters = 0
+    start = time.perf_counter()
+    for path in args.files:
+        with open(path, "r") as file:
+            code = file.read()
+        characters += len(code)
+        analyzeSource(code, LexerMode.RECOGNIZER, profile=profile)
+    elapsed = time.perf_counter() - start
+
+    print(formatProfile(profile))
+    print(f"{len(args.files)} files, {characters} chars in {elapsed:.2f}s")
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "files": len(args.files),
+                    "chars": characters,
+                    "seconds": elapsed,
+                    "recognizers": profileRows(profile),
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
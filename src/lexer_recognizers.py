@@ -1,4 +1,10 @@
 from lexer_types import LexerTokenTypeState, LexerTokenTypeAcceptState
+from lexer_characters import (
+    CHARACTER_BLANK,
+    CHARACTER_DIGIT,
+    CHARACTER_IDENTIFIER_PART,
+    CHARACTER_IDENTIFIER_START,
+)
 
 
 def nullRecognizer(state: LexerTokenTypeState, character: str):
@@ -14,16 +20,16 @@ def placeholderRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def identifierRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
-        if character.isalpha() or character == "_":
-            state.current_state = "q1"
+    if state.current_state == 0:
+        if state.character_class & CHARACTER_IDENTIFIER_START:
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
-        if character.isalnum() or character == "_":
-            state.current_state = "q1"
+    if state.current_state == 1:
+        if state.character_class & CHARACTER_IDENTIFIER_PART:
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -33,16 +39,16 @@ def identifierRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def whitespaceRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
-        if character.isspace() and character != "\n":
-            state.current_state = "q1"
+    if state.current_state == 0:
+        if state.character_class & CHARACTER_BLANK:
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
-        if character.isspace() and character != "\n":
-            state.current_state = "q1"
+    if state.current_state == 1:
+        if state.character_class & CHARACTER_BLANK:
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -52,9 +58,9 @@ def whitespaceRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def newlineRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "\n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -64,50 +70,50 @@ def newlineRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def commentRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "/":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
 
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "/":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         elif character == "*":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
 
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character != "\n":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
 
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "*":
-            state.current_state = "q4"
+            state.current_state = 4
         else:
-            state.current_state = "q3"
+            state.current_state = 3
         state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         return state
 
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "/":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         elif character == "*":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         return state
 
@@ -116,9 +122,9 @@ def commentRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def plusSymbolRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "+":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -128,9 +134,9 @@ def plusSymbolRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def minusSymbolRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "-":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -140,9 +146,9 @@ def minusSymbolRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def starSymbolRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "*":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -152,9 +158,9 @@ def starSymbolRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def slashSymbolRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "/":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -164,9 +170,9 @@ def slashSymbolRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def percentSymbolRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "%":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -176,9 +182,9 @@ def percentSymbolRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def caretSymbolRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "^":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -188,16 +194,16 @@ def caretSymbolRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def incrementOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "+":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "+":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -207,16 +213,16 @@ def incrementOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def decrementOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "-":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "-":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -226,9 +232,9 @@ def decrementOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def lessOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "<":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -238,16 +244,16 @@ def lessOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def lessOrEqualOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "<":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -257,9 +263,9 @@ def lessOrEqualOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def greaterOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == ">":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -269,16 +275,16 @@ def greaterOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def greaterOrEqualOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == ">":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -288,16 +294,16 @@ def greaterOrEqualOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def notEqualOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "!":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -307,16 +313,16 @@ def notEqualOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def equalOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "=":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -326,9 +332,9 @@ def equalOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def notOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "!":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -338,16 +344,16 @@ def notOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def andOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "&":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "&":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -357,16 +363,16 @@ def andOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def orOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "|":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "|":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -376,9 +382,9 @@ def orOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def assignmentOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "=":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -388,16 +394,16 @@ def assignmentOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def plusAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "+":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -407,16 +413,16 @@ def plusAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def minusAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "-":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -426,16 +432,16 @@ def minusAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def multiplyAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "*":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -445,16 +451,16 @@ def multiplyAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def divideAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "/":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -464,16 +470,16 @@ def divideAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def moduloAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "%":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "=":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -483,16 +489,16 @@ def moduloAssignmentOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def percentScaleOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "*":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "%":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -502,16 +508,16 @@ def percentScaleOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def markupOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "+":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "%":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -521,16 +527,16 @@ def markupOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def markdownOpRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "-":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "%":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -540,30 +546,30 @@ def markdownOpRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def voidTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "v":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "i":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "d":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -573,51 +579,51 @@ def voidTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def intTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "i":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "n":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "t":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "g":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "e":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "r":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -627,37 +633,37 @@ def intTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def floatTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "l":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "o":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "a":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "t":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -667,51 +673,51 @@ def floatTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def boolTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "b":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "o":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "l":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "e":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "a":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "n":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -721,65 +727,65 @@ def boolTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def charTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "h":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "a":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "r":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "a":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "c":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "t":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q7":
+    if state.current_state == 7:
         if character == "e":
-            state.current_state = "q8"
+            state.current_state = 8
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q8":
+    if state.current_state == 8:
         if character == "r":
-            state.current_state = "q9"
+            state.current_state = 9
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -789,44 +795,44 @@ def charTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def strTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "s":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "t":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "r":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "i":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "n":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "g":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -837,16 +843,16 @@ def strTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def ifStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "i":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "f":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -856,30 +862,30 @@ def ifStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def elseStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "e":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "l":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "s":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -889,30 +895,30 @@ def elseStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def elifStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "e":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "l":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "i":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "f":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -922,23 +928,23 @@ def elifStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def forLoopRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "r":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -948,37 +954,37 @@ def forLoopRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def whileLoopRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "w":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "h":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "i":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "l":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "e":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -988,30 +994,30 @@ def whileLoopRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def scanFunctionRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "s":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "c":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "a":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "n":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1021,37 +1027,37 @@ def scanFunctionRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def printFunctionRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "p":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "r":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "i":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "n":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "t":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1061,30 +1067,30 @@ def printFunctionRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def nextStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "x":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "t":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1094,30 +1100,30 @@ def nextStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def stopStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "s":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "t":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "o":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "p":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1127,44 +1133,44 @@ def stopStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def returnStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "r":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "t":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "u":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "r":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "n":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1174,58 +1180,58 @@ def returnStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def funcStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "u":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "n":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "c":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "t":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "i":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "o":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q7":
+    if state.current_state == 7:
         if character == "n":
-            state.current_state = "q8"
+            state.current_state = 8
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1235,58 +1241,58 @@ def funcStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def constStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "n":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "s":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "t":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "a":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "n":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q7":
+    if state.current_state == 7:
         if character == "t":
-            state.current_state = "q8"
+            state.current_state = 8
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1296,44 +1302,44 @@ def constStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def staticStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "s":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "t":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "a":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "t":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "i":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "c":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1343,51 +1349,51 @@ def staticStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def defaultStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "d":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "f":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "a":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "u":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "l":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "t":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1397,30 +1403,30 @@ def defaultStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def caseStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "a":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "s":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1430,30 +1436,30 @@ def caseStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def trueStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "t":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "r":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "u":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1463,37 +1469,37 @@ def trueStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def falseStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "a":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "l":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "s":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "e":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1503,37 +1509,37 @@ def falseStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def sweepStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "s":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "w":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "e":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "p":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1543,37 +1549,37 @@ def sweepStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def rangeStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "r":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "a":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "n":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "g":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "e":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1583,30 +1589,30 @@ def rangeStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def jumpStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "j":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "u":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "m":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "p":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1616,44 +1622,44 @@ def jumpStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def switchStatementRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "s":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "w":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "i":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "t":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "c":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "h":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1663,29 +1669,29 @@ def switchStatementRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def intLiteralRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "-":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         elif character == "0":
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
-        elif character.isdigit() and character != "0":
-            state.current_state = "q2"
+        elif state.character_class & CHARACTER_DIGIT and character != "0":
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "0":
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
-        elif character.isdigit() and character != "0":
-            state.current_state = "q2"
+        elif state.character_class & CHARACTER_DIGIT and character != "0":
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
-        if character.isdigit():
+    if state.current_state == 2:
+        if state.character_class & CHARACTER_DIGIT:
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1695,48 +1701,48 @@ def intLiteralRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def floatLiteralRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "-":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
-        elif character.isdigit():
-            state.current_state = "q2"
+        elif state.character_class & CHARACTER_DIGIT:
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         elif character == ".":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
-        if character.isdigit():
-            state.current_state = "q2"
+    if state.current_state == 1:
+        if state.character_class & CHARACTER_DIGIT:
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         elif character == ".":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
-        if character.isdigit():
-            state.current_state = "q2"
+    if state.current_state == 2:
+        if state.character_class & CHARACTER_DIGIT:
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         elif character == ".":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
-        if character.isdigit():
-            state.current_state = "q4"
+    if state.current_state == 3:
+        if state.character_class & CHARACTER_DIGIT:
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
-        if character.isdigit():
+    if state.current_state == 4:
+        if state.character_class & CHARACTER_DIGIT:
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1748,29 +1754,29 @@ def floatLiteralRecognizer(state: LexerTokenTypeState, character: str):
 
 # For now accept char literal with n > 1, syntax analyzer's job
 def charLiteralRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "'":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "\\":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         elif character == "'":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         elif character != "\n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character != "\n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1780,29 +1786,29 @@ def charLiteralRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def stringLiteralRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == '"':
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "\\":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         elif character == '"':
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         elif character != "\n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character != "\n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1812,51 +1818,51 @@ def stringLiteralRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def percentTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "p":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "r":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "c":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "e":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "n":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "t":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1866,58 +1872,58 @@ def percentTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def xpercentTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "x":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "p":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "e":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "r":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "c":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "e":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "n":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q7":
+    if state.current_state == 7:
         if character == "t":
-            state.current_state = "q8"
+            state.current_state = 8
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1927,58 +1933,58 @@ def xpercentTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def positiveTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "p":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "s":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "i":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "t":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "i":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "v":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q7":
+    if state.current_state == 7:
         if character == "e":
-            state.current_state = "q8"
+            state.current_state = 8
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -1988,58 +1994,58 @@ def positiveTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def negativeTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "g":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "a":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "t":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "i":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "v":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q7":
+    if state.current_state == 7:
         if character == "e":
-            state.current_state = "q8"
+            state.current_state = 8
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2049,51 +2055,51 @@ def negativeTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def nonzeroTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "n":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "z":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "e":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "r":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "o":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2103,30 +2109,30 @@ def nonzeroTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def evenTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "e":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "v":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "e":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "n":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2136,23 +2142,23 @@ def evenTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def oddTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "o":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "d":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "d":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2162,65 +2168,65 @@ def oddTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def autoTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "a":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "u":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "t":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "o":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "m":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "a":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q6":
+    if state.current_state == 6:
         if character == "t":
-            state.current_state = "q7"
+            state.current_state = 7
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q7":
+    if state.current_state == 7:
         if character == "i":
-            state.current_state = "q8"
+            state.current_state = 8
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q8":
+    if state.current_state == 8:
         if character == "c":
-            state.current_state = "q9"
+            state.current_state = 9
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2230,44 +2236,44 @@ def autoTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def secondTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "s":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "c":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "o":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "n":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "d":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2277,44 +2283,44 @@ def secondTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def minuteTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "i":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "n":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "u":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "t":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "e":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2324,30 +2330,30 @@ def minuteTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def hourTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "h":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "u":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "r":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2357,23 +2363,23 @@ def hourTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def dayTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "d":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "a":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "y":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2383,30 +2389,30 @@ def dayTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def weekTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "w":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "e":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "k":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2416,37 +2422,37 @@ def weekTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def monthTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "o":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "n":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "t":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "h":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2456,30 +2462,30 @@ def monthTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def yearTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "y":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "a":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "r":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2489,37 +2495,37 @@ def yearTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def meterTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "t":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "r":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2529,16 +2535,16 @@ def meterTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def mmTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "m":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2548,16 +2554,16 @@ def mmTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def cmTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "m":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2567,16 +2573,16 @@ def cmTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def kmTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "k":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "m":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2586,16 +2592,16 @@ def kmTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def ftTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "t":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2605,30 +2611,30 @@ def ftTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def inchTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "i":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "n":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "c":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "h":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2638,44 +2644,44 @@ def inchTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def meter2TypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "t":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "r":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q5":
+    if state.current_state == 5:
         if character == "2":
-            state.current_state = "q6"
+            state.current_state = 6
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2685,23 +2691,23 @@ def meter2TypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def mm2TypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "m":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "2":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2711,23 +2717,23 @@ def mm2TypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def cm2TypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "m":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "2":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2737,23 +2743,23 @@ def cm2TypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def km2TypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "k":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "m":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "2":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2763,23 +2769,23 @@ def km2TypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def ft2TypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "t":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "2":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2789,37 +2795,37 @@ def ft2TypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def inch2TypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "i":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "n":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "c":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "h":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "2":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2829,37 +2835,37 @@ def inch2TypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def literTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "l":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "i":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "t":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "e":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q4":
+    if state.current_state == 4:
         if character == "r":
-            state.current_state = "q5"
+            state.current_state = 5
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2869,16 +2875,16 @@ def literTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def mlTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "l":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2888,16 +2894,16 @@ def mlTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def clTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "l":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2907,16 +2913,16 @@ def clTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def klTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "k":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "l":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2926,30 +2932,30 @@ def klTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def gramTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "g":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "r":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "a":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "m":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2959,16 +2965,16 @@ def gramTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def mgTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "g":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2978,16 +2984,16 @@ def mgTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def cgTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "g":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -2997,16 +3003,16 @@ def cgTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def kgTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "k":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "g":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3016,30 +3022,30 @@ def kgTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def celcTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "c":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "l":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "c":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3049,30 +3055,30 @@ def celcTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def fahrTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "a":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "h":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "r":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3082,30 +3088,30 @@ def fahrTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def kelvTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "k":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "l":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "v":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3115,30 +3121,30 @@ def kelvTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def newtTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "n":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "e":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "w":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "t":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3148,23 +3154,23 @@ def newtTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def kgfTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "k":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "g":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "f":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3174,23 +3180,23 @@ def kgfTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def lbfTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "l":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "b":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "f":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3200,23 +3206,23 @@ def lbfTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def mpsTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "p":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "s":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3226,23 +3232,23 @@ def mpsTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def fpsTypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "f":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "p":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "s":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3252,30 +3258,30 @@ def fpsTypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def mps2TypeRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "m":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q1":
+    if state.current_state == 1:
         if character == "p":
-            state.current_state = "q2"
+            state.current_state = 2
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q2":
+    if state.current_state == 2:
         if character == "s":
-            state.current_state = "q3"
+            state.current_state = 3
             state.acceptance = LexerTokenTypeAcceptState.IN_PROGRESS
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
         return state
-    if state.current_state == "q3":
+    if state.current_state == 3:
         if character == "2":
-            state.current_state = "q4"
+            state.current_state = 4
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3285,9 +3291,9 @@ def mps2TypeRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def commaDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == ",":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3297,9 +3303,9 @@ def commaDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def semiColonDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == ";":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3309,9 +3315,9 @@ def semiColonDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def colonDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == ":":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3321,9 +3327,9 @@ def colonDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def openParenthesisDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "(":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3333,9 +3339,9 @@ def openParenthesisDelimiterRecognizer(state: LexerTokenTypeState, character: st
 
 
 def closedParenthesisDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == ")":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3345,9 +3351,9 @@ def closedParenthesisDelimiterRecognizer(state: LexerTokenTypeState, character:
 
 
 def openSquareDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "[":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3357,9 +3363,9 @@ def openSquareDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def closedSquareDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "]":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3369,9 +3375,9 @@ def closedSquareDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def openAngleDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "<":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3381,9 +3387,9 @@ def openAngleDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def closedAngleDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == ">":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3393,9 +3399,9 @@ def closedAngleDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def openCurlyDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "{":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3405,9 +3411,9 @@ def openCurlyDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def closedCurlyDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "}":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
@@ -3417,9 +3423,9 @@ def closedCurlyDelimiterRecognizer(state: LexerTokenTypeState, character: str):
 
 
 def verticalBarDelimiterRecognizer(state: LexerTokenTypeState, character: str):
-    if state.current_state == "q0":
+    if state.current_state == 0:
         if character == "|":
-            state.current_state = "q1"
+            state.current_state = 1
             state.acceptance = LexerTokenTypeAcceptState.ACCEPTED
         else:
             state.acceptance = LexerTokenTypeAcceptState.REJECTED
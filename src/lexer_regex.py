@@ -0,0 +1,131 @@
+import re
+from array import array
+
+from lexer_token import TokenType, TokenArray
+from lexer_analyzer import recognizer_list, analyzeScannedSource
+from lexer_dfa import makeInvalidSkip
+from lexer_dispatch import getDispatchIndex, makeDispatchScan
+from lexer_keywords import isIdentifierWord, recognizerWords
+
+
+def numericNonAlphaCharacters():
+    # \w is exactly isalnum() or "_", but \d only covers decimal digits, so the
+    # remaining numeric characters have to be listed explicitly
+    below_surrogates = array("I", range(0xD800)).tobytes().decode("utf-32-le")
+    above_surrogates = array("I", range(0xE000, 0x110000)).tobytes().decode("utf-32-le")
+    return [
+        character
+        for character in re.findall(r"[^\W\d_]", below_surrogates + above_surrogates)
+        if not character.isalpha()
+    ]
+
+
+def buildPatternTable():
+    numeric = numericNonAlphaCharacters()
+    extra_digits = "".join(
+        re.escape(character) for character in numeric if character.isdigit()
+    )
+    numeric_non_alpha = "".join(re.escape(character) for character in numeric)
+    digit = rf"[\d{extra_digits}]"
+    nonzero_digit = rf"(?!0){digit}"
+
+    return {
+        TokenType.IDENTIFIER: rf"[^\W\d{numeric_non_alpha}]\w*",
+        TokenType.WHITESPACE: r"[^\S\n]+",
+        TokenType.COMMENT: r"//[^\n]*|/\*[^*]*\*+(?:[^*/][^*]*\*+)*/",
+        TokenType.INT_LITERAL: (
+            rf"0*(?:-0*{nonzero_digit}{digit}*|-0+|{nonzero_digit}{digit}*)|0+"
+        ),
+        TokenType.FLOAT_LITERAL: rf"-?{digit}*\.{digit}+",
+        TokenType.CHAR_LITERAL: r"'(?:[^'\\\n]|\\[^\n])*'",
+        TokenType.STRING_LITERAL: r'"(?:[^"\\\n]|\\[^\n])*"',
+    }, (
+        # Input that keeps a recognizer in progress until the end of the
+        # source, where the recognizer loop stops instead of rescanning
+        r"/\*(?:[^*]|\*+[^*/])*\**\Z"
+        r"|'(?:[^'\\\n]|\\[^\n])*\\?\Z"
+        r'|"(?:[^"\\\n]|\\[^\n])*\\?\Z'
+        rf"|-?{digit}*\.\Z"
+        r"|0+-\Z"
+    )
+
+
+def buildMasterPattern():
+    patterns, unterminated = buildPatternTable()
+
+    literals: dict[str, int] = {}
+    keywords: dict[str, int] = {}
+    for type_value, recognizer in enumerate(recognizer_list):
+        token_type = TokenType(type_value)
+        if token_type in patterns:
+            continue
+        words = recognizerWords(recognizer)
+        if words is None:
+            raise ValueError(f"No regex pattern for {token_type.name}")
+        for word in words:
+            table = keywords if isIdentifierWord(word) else literals
+            table[word] = max(table.get(word, -1), type_value)
+
+    def groupWords(table: dict[str, int]):
+        groups: dict[int, list[str]] = {}
+        for word, type_value in table.items():
+            groups.setdefault(type_value, []).append(word)
+        for words in groups.values():
+            words.sort(key=len, reverse=True)
+        return groups
+
+    literal_groups = groupWords(literals)
+
+    # Whitespace and words cannot start any other token, so they go first
+    alternatives = [
+        f"(?P<WHITESPACE>{patterns[TokenType.WHITESPACE]})",
+        f"(?P<WORD>{patterns[TokenType.IDENTIFIER]})",
+        f"(?P<UNTERMINATED>{unterminated})",
+    ]
+    for token_type in [
+        TokenType.COMMENT,
+        TokenType.FLOAT_LITERAL,
+        TokenType.INT_LITERAL,
+        TokenType.CHAR_LITERAL,
+        TokenType.STRING_LITERAL,
+    ]:
+        alternatives.append(f"(?P<{token_type.name}>{patterns[token_type]})")
+    for type_value, words in sorted(
+        literal_groups.items(), key=lambda group: -len(group[1][0])
+    ):
+        spelled = "|".join(re.escape(word) for word in words)
+        alternatives.append(f"(?P<{TokenType(type_value).name}>{spelled})")
+
+    return re.compile("|".join(alternatives)), keywords
+
+
+master_pattern: re.Pattern | None = None
+master_keywords: dict[str, int] = {}
+
+
+def getMasterPattern():
+    global master_pattern, master_keywords
+    if master_pattern is None:
+        master_pattern, master_keywords = buildMasterPattern()
+    return master_pattern
+
+
+def analyzeSourceRegex(code: str, tokens: TokenArray | None = None):
+    match = getMasterPattern().match
+    keywords = master_keywords
+    identifier = TokenType.IDENTIFIER.value
+    group_types = {token_type.name: token_type.value for token_type in TokenType}
+    fallback_scan = makeDispatchScan(code, getDispatchIndex())
+    code_length = len(code)
+
+    def scan(start_index: int):
+        matched = match(code, start_index)
+        if matched is None or matched.lastgroup == "UNTERMINATED":
+            return fallback_scan(start_index)
+        end = matched.end()
+        group = matched.lastgroup
+        if group == "WORD":
+            return end, keywords.get(matched.group(), identifier), end
+        return end, group_types[group], end
+
+    return analyzeScannedSource(code_length, scan, tokens, makeInvalidSkip(code))
@@ -0,0 +1,137 @@
+from lexer_token import Token, TokenType, token_types
+from lexer_dfa import getDfaTables, classifySource
+
+
+class StreamingLexer:
+    def __init__(self):
+        tables = getDfaTables()
+        self.transitions = tables.transitions
+        self.accepts = tables.accepts
+        self.start_state = tables.start_state
+        # Buffer positions are relative to buffer_offset in the source. The
+        # scan never reads behind the longest accept, or behind the current
+        # index before anything was accepted, so only the classes from there
+        # on are kept and the start of the pending token may lie before the
+        # buffer
+        self.classes = bytearray()
+        self.buffer_offset = 0
+        self.start_index = 0
+        self.state = self.start_state
+        self.index = 0
+        self.longest_end = -1
+        self.longest_type = -1
+        self.closed = False
+        self.finished = False
+
+    def feed(self, chunk: str) -> list[Token]:
+        if self.closed:
+            raise ValueError("feed() called after close()")
+        consumed = self.longest_end if self.longest_end != -1 else self.index
+        del self.classes[:consumed]
+        self.classes += classifySource(chunk)
+        self.buffer_offset += consumed
+        self.start_index -= consumed
+        self.index -= consumed
+        if self.longest_end != -1:
+            self.longest_end -= consumed
+        return self.drain()
+
+    def close(self) -> list[Token]:
+        if self.closed:
+            return []
+        self.closed = True
+        tokens = self.drain()
+        end = self.buffer_offset + len(self.classes)
+        tokens.append(Token(TokenType.ENDMARKER, end, end))
+        self.classes = bytearray()
+        return tokens
+
+    def drain(self) -> list[Token]:
+        tokens: list[Token] = []
+        transitions = self.transitions
+        accepts = self.accepts
+        classes = self.classes
+        offset = self.buffer_offset
+        buffer_length = len(classes)
+        start_index = self.start_index
+        state = self.state
+        index = self.index
+        longest_end = self.longest_end
+        longest_type = self.longest_type
+
+        while not self.finished and start_index < buffer_length:
+            stopped = False
+            while index < buffer_length:
+                next_state = transitions[state][classes[index]]
+                if next_state < 0:
+                    stopped = True
+                    break
+                state = next_state
+                index += 1
+                if accepts[state] >= 0:
+                    longest_end = index
+                    longest_type = accepts[state]
+
+            if not stopped:
+                if not self.closed:
+                    # The token may continue in the next chunk
+                    break
+                if longest_end == -1:
+                    tokens.append(
+                        Token(
+                            TokenType.INVALID,
+                            offset + start_index,
+                            offset + buffer_length,
+                        )
+                    )
+                else:
+                    tokens.append(
+                        Token(
+                            token_types[longest_type],
+                            offset + start_index,
+                            offset + longest_end,
+                        )
+                    )
+                self.finished = True
+                break
+
+            if longest_end == -1:
+                invalid_start = start_index if start_index == index else index
+                tokens.append(
+                    Token(
+                        TokenType.INVALID,
+                        offset + invalid_start,
+                        offset + invalid_start + 1,
+                    )
+                )
+                start_index = invalid_start + 1
+            else:
+                tokens.append(
+                    Token(
+                        token_types[longest_type],
+                        offset + start_index,
+                        offset + longest_end,
+                    )
+                )
+                start_index = longest_end
+            state = self.start_state
+            index = start_index
+            longest_end = -1
+            longest_type = -1
+
+        self.start_index = start_index
+        self.state = state
+        self.index = index
+        self.longest_end = longest_end
+        self.longest_type = longest_type
+        return tokens
+
+
+def lexStream(file, chunk_size: int = 1 << 16):
+    lexer = StreamingLexer()
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield from lexer.feed(chunk)
+    yield from lexer.close()
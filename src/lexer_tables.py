@@ -0,0 +1,158 @@
+import hashlib
+import os
+import struct
+import sys
+from array import array
+
+from lexer_types import LexerDfaTables
+
+
+TABLES_MAGIC = b"NLT1"
+TABLES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "lexer_tables.bin"
+)
+# TokenType, the recognizers, the recognizer list and the table builder all
+# shape the tables, and the driver's emission rules shape the cached token
+# streams keyed by the same version, so their sources make up the version
+VERSION_SOURCES = [
+    "lexer_token.py",
+    "lexer_recognizers.py",
+    "lexer_characters.py",
+    "lexer_analyzer.py",
+    "lexer_dfa.py",
+    "lexer_driver.py",
+]
+HEADER = struct.Struct("<4s16sHHH")
+
+tables_version: str | None = None
+
+
+def tablesVersion():
+    global tables_version
+    if tables_version is None:
+        digest = hashlib.sha256()
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in VERSION_SOURCES:
+            with open(os.path.join(directory, name), "rb") as file:
+                digest.update(file.read())
+        tables_version = digest.hexdigest()[:16]
+    return tables_version
+
+
+def signatureIndex(signature: tuple[bool, bool, bool, bool]):
+    alpha, alnum, digit, space = signature
+    return alpha << 3 | alnum << 2 | digit << 1 | space
+
+
+def encodeDfaTables(tables: LexerDfaTables) -> bytes:
+    class_count = len(tables.transitions[0])
+    character_classes = bytes(
+        tables.character_classes[chr(code)] for code in range(128)
+    )
+    signature_classes = bytearray([255] * 16)
+    for signature, character_class in tables.signature_classes.items():
+        signature_classes[signatureIndex(signature)] = character_class
+    transitions = array("h", [target for row in tables.transitions for target in row])
+    accepts = array("h", tables.accepts)
+    if sys.byteorder != "little":
+        transitions.byteswap()
+        accepts.byteswap()
+    return b"".join(
+        [
+            HEADER.pack(
+                TABLES_MAGIC,
+                tablesVersion().encode(),
+                len(tables.transitions),
+                class_count,
+                tables.start_state,
+            ),
+            character_classes,
+            bytes(signature_classes),
+            accepts.tobytes(),
+            transitions.tobytes(),
+        ]
+    )
+
+
+def decodeDfaTables(data: bytes) -> LexerDfaTables | None:
+    if len(data) < HEADER.size:
+        return None
+    magic, version, state_count, class_count, start_state = HEADER.unpack_from(data)
+    if magic != TABLES_MAGIC or version != tablesVersion().encode():
+        return None
+    accepts = array("h")
+    transitions = array("h")
+    offset = HEADER.size
+    # A truncated or corrupted artifact is rebuilt like an outdated one
+    expected = (
+        offset + 128 + 16 + (state_count + state_count * class_count) * accepts.itemsize
+    )
+    if len(data) != expected:
+        return None
+    character_classes = data[offset : offset + 128]
+    offset += 128
+    signature_classes = data[offset : offset + 16]
+    offset += 16
+    accepts.frombytes(data[offset : offset + state_count * accepts.itemsize])
+    offset += state_count * accepts.itemsize
+    transitions.frombytes(data[offset:])
+    if sys.byteorder != "little":
+        transitions.byteswap()
+        accepts.byteswap()
+
+    signatures = {}
+    for alpha in (False, True):
+        for alnum in (False, True):
+            for digit in (False, True):
+                for space in (False, True):
+                    signature = (alpha, alnum, digit, space)
+                    character_class = signature_classes[signatureIndex(signature)]
+                    if character_class != 255:
+                        signatures[signature] = character_class
+    return LexerDfaTables(
+        character_classes={
+            chr(code): character_class
+            for code, character_class in enumerate(character_classes)
+        },
+        signature_classes=signatures,
+        transitions=[
+            transitions[state * class_count : (state + 1) * class_count].tolist()
+            for state in range(state_count)
+        ],
+        accepts=accepts.tolist(),
+        start_state=start_state,
+    )
+
+
+def loadDfaTables(path: str = TABLES_PATH) -> LexerDfaTables | None:
+    try:
+        with open(path, "rb") as file:
+            return decodeDfaTables(file.read())
+    except OSError:
+        return None
+
+
+def saveDfaTables(tables: LexerDfaTables, path: str = TABLES_PATH):
+    # A read-only install keeps working from the freshly built tables
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(encodeDfaTables(tables))
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+
+
+def main():
+    from lexer_dfa import buildDfaTables
+
+    tables = buildDfaTables()
+    saveDfaTables(tables)
+    print(
+        f"{TABLES_PATH}: version {tablesVersion()}, {len(tables.transitions)} states, "
+        f"{len(tables.transitions[0])} classes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 
@@ -129,3 +130,264 @@ class Token:
     type: TokenType
     start: int
     end: int
+    # Only filled when the lexer tracked positions, they follow from the
+    # offsets so they take no part in comparisons
+    line: int | None = field(default=None, compare=False, repr=False)
+    column: int | None = field(default=None, compare=False, repr=False)
+    end_line: int | None = field(default=None, compare=False, repr=False)
+    end_column: int | None = field(default=None, compare=False, repr=False)
+
+
+token_types = list(TokenType)
+invalid_type_value = TokenType.INVALID.value
+
+
+class TokenView:
+    __slots__ = ("tokens", "index")
+
+    def __init__(self, tokens: "TokenArray", index: int):
+        self.tokens = tokens
+        self.index = index
+
+    @property
+    def type(self) -> TokenType:
+        return token_types[self.tokens.types[self.index]]
+
+    @property
+    def start(self) -> int:
+        return self.tokens.starts[self.index]
+
+    @property
+    def end(self) -> int:
+        return self.tokens.ends[self.index]
+
+    @property
+    def line(self) -> int | None:
+        lines = self.tokens.lines
+        return None if lines is None else lines[self.index]
+
+    @property
+    def column(self) -> int | None:
+        columns = self.tokens.columns
+        return None if columns is None else columns[self.index]
+
+    @property
+    def end_line(self) -> int | None:
+        end_lines = self.tokens.end_lines
+        return None if end_lines is None else end_lines[self.index]
+
+    @property
+    def end_column(self) -> int | None:
+        end_columns = self.tokens.end_columns
+        return None if end_columns is None else end_columns[self.index]
+
+    def toToken(self) -> Token:
+        return Token(
+            self.type,
+            self.start,
+            self.end,
+            self.line,
+            self.column,
+            self.end_line,
+            self.end_column,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, (Token, TokenView)):
+            return NotImplemented
+        return (self.type, self.start, self.end) == (other.type, other.start, other.end)
+
+    def __repr__(self):
+        return f"Token(type={self.type!r}, start={self.start}, end={self.end})"
+
+
+class TokenArray:
+    def __init__(
+        self,
+        types=None,
+        starts=None,
+        ends=None,
+        lines=None,
+        columns=None,
+        end_lines=None,
+        end_columns=None,
+    ):
+        # Type values, start offsets and end offsets live in parallel compact
+        # buffers, slices are index ranges over them instead of copies
+        self.types = array("B") if types is None else types
+        self.starts = array("q") if starts is None else starts
+        self.ends = array("q") if ends is None else ends
+        # Line and column columns only exist when positions are tracked
+        self.lines = lines
+        self.columns = columns
+        self.end_lines = end_lines
+        self.end_columns = end_columns
+        self.code: str | None = None
+        self.coalesce_invalid = False
+
+    def trackPositions(self, code: str):
+        self.code = code
+        self.lines = array("I")
+        self.columns = array("I")
+        self.end_lines = array("I")
+        self.end_columns = array("I")
+        self.position = 0
+        self.line = 1
+        self.line_start = 0
+
+    def advancePosition(self, offset: int):
+        code = self.code
+        newlines = code.count("\n", self.position, offset)
+        if newlines:
+            self.line += newlines
+            self.line_start = code.rfind("\n", self.position, offset) + 1
+        self.position = offset
+
+    def appendToken(self, type_value: int, start: int, end: int):
+        if (
+            self.coalesce_invalid
+            and type_value == invalid_type_value
+            and self.types
+            and self.types[-1] == invalid_type_value
+            and self.ends[-1] == start
+        ):
+            self.ends[-1] = end
+            if self.code is not None:
+                self.advancePosition(end)
+                self.end_lines[-1] = self.line
+                self.end_columns[-1] = end - self.line_start + 1
+            return
+        self.types.append(type_value)
+        self.starts.append(start)
+        self.ends.append(end)
+        if self.code is not None:
+            # Tokens arrive in source order, so only the text since the last
+            # token is searched for newlines
+            self.advancePosition(start)
+            self.lines.append(self.line)
+            self.columns.append(start - self.line_start + 1)
+            self.advancePosition(end)
+            self.end_lines.append(self.line)
+            self.end_columns.append(end - self.line_start + 1)
+
+    def append(self, token: Token):
+        self.appendToken(token.type.value, token.start, token.end)
+
+    def extend(self, tokens: "TokenArray"):
+        if self.code is not None or self.coalesce_invalid:
+            for type_value, start, end in zip(tokens.types, tokens.starts, tokens.ends):
+                self.appendToken(type_value, start, end)
+            return
+        self.types.extend(tokens.types)
+        self.starts.extend(tokens.starts)
+        self.ends.extend(tokens.ends)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TokenArraySlice(self, range(len(self.types))[index])
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError("token index out of range")
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.types)):
+            yield TokenView(self, index)
+
+    def toList(self) -> list[Token]:
+        if self.lines is not None:
+            return [
+                Token(token_types[type_value], *fields)
+                for type_value, *fields in zip(
+                    self.types,
+                    self.starts,
+                    self.ends,
+                    self.lines,
+                    self.columns,
+                    self.end_lines,
+                    self.end_columns,
+                )
+            ]
+        return [
+            Token(token_types[type_value], start, end)
+            for type_value, start, end in zip(self.types, self.starts, self.ends)
+        ]
+
+
+def sliceColumn(column: array, indexes: range) -> array:
+    # A reversed range can stop at -1, which a slice would read as the end
+    if indexes.step > 0 or indexes.stop >= 0:
+        return column[indexes.start : indexes.stop : indexes.step]
+    return array(column.typecode, [column[index] for index in indexes])
+
+
+class TokenArraySlice:
+    __slots__ = ("tokens", "indexes")
+
+    def __init__(self, tokens: TokenArray, indexes: range):
+        # Only the range of indexes is kept, so the parent can still grow
+        # while slices of it are alive
+        self.tokens = tokens
+        self.indexes = indexes
+
+    def __len__(self):
+        return len(self.indexes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TokenArraySlice(self.tokens, self.indexes[index])
+        return TokenView(self.tokens, self.indexes[index])
+
+    def __iter__(self):
+        for index in self.indexes:
+            yield TokenView(self.tokens, index)
+
+    def toArray(self) -> TokenArray:
+        tokens = self.tokens
+        indexes = self.indexes
+        return TokenArray(
+            *(
+                None if column is None else sliceColumn(column, indexes)
+                for column in [
+                    tokens.types,
+                    tokens.starts,
+                    tokens.ends,
+                    tokens.lines,
+                    tokens.columns,
+                    tokens.end_lines,
+                    tokens.end_columns,
+                ]
+            )
+        )
+
+    def toList(self) -> list[Token]:
+        return [TokenView(self.tokens, index).toToken() for index in self.indexes]
+
+
+trivia_type_values = frozenset(
+    [TokenType.WHITESPACE.value, TokenType.NEWLINE.value, TokenType.COMMENT.value]
+)
+
+
+class TriviaFilter(TokenArray):
+    def __init__(self, tokens: TokenArray, trivia: TokenArray | None = None):
+        # Trivia goes to the side table or is dropped before it is ever stored
+        super().__init__(tokens.types, tokens.starts, tokens.ends)
+        self.coalesce_invalid = tokens.coalesce_invalid
+        self.tokens = tokens
+        self.trivia = trivia
+
+    def appendToken(self, type_value: int, start: int, end: int):
+        if type_value in trivia_type_values:
+            if self.trivia is not None:
+                self.trivia.appendToken(type_value, start, end)
+            return
+        self.tokens.appendToken(type_value, start, end)
+
+    def extend(self, tokens: TokenArray):
+        for type_value, start, end in zip(tokens.types, tokens.starts, tokens.ends):
+            self.appendToken(type_value, start, end)
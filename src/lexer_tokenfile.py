@@ -0,0 +1,191 @@
+import hashlib
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+from lexer_token import Token, TokenType, token_types
+
+
+TOKEN_FILE_MAGIC = b"NTF1"
+TOKEN_FILE_VERSION = 2
+TOKEN_FILE_LEXEMES = 1
+TOKEN_FILE_POSITIONS = 2
+# magic, format version, flags, token type set, record count, lexeme table
+# offset and size
+HEADER = struct.Struct("<4sHH8sQQQ")
+# start, end, lexeme offset, line, column, type, padding to keep the 8-byte
+# fields of every record aligned
+RECORD = struct.Struct("<qqqIIH6x")
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def tokenTypesVersion():
+    # Records store type values, so renumbering TokenType invalidates files
+    names = ",".join(token_type.name for token_type in TokenType)
+    return hashlib.sha256(names.encode()).digest()[:8]
+
+
+def writeTokenFile(file, tokens, code: str | None = None):
+    # The file has to be empty and seekable, the header is written last once
+    # the record count is known. Lexemes go through a temporary file so
+    # neither the records nor the lexemes are held in memory.
+    file.write(bytes(HEADER.size))
+    lexemes = None if code is None else tempfile.TemporaryFile()
+    lexeme_offset = 0
+    count = 0
+    # Tokens lexed without positions are stored with line and column 0 and
+    # the file is marked as having no positions
+    positions = True
+    buffer = bytearray()
+    pack = RECORD.pack
+    for token in tokens:
+        line = token.line
+        column = token.column
+        if line is None or column is None:
+            positions = False
+            line = column = 0
+        buffer += pack(
+            token.start,
+            token.end,
+            lexeme_offset,
+            line,
+            column,
+            token.type.value,
+        )
+        if lexemes is not None:
+            lexeme = code[token.start : token.end].encode("utf-8", "surrogatepass")
+            lexemes.write(lexeme)
+            lexeme_offset += len(lexeme)
+        count += 1
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            file.write(buffer)
+            buffer.clear()
+    file.write(buffer)
+
+    flags = TOKEN_FILE_POSITIONS if positions else 0
+    lexeme_table_offset = 0
+    if lexemes is not None:
+        flags |= TOKEN_FILE_LEXEMES
+        lexeme_table_offset = HEADER.size + count * RECORD.size
+        lexemes.seek(0)
+        shutil.copyfileobj(lexemes, file)
+        lexemes.close()
+    file.seek(0)
+    file.write(
+        HEADER.pack(
+            TOKEN_FILE_MAGIC,
+            TOKEN_FILE_VERSION,
+            flags,
+            tokenTypesVersion(),
+            count,
+            lexeme_table_offset,
+            lexeme_offset,
+        )
+    )
+    file.seek(0, 2)
+
+
+def saveTokenFile(path: str, tokens, code: str | None = None):
+    # A failed write leaves no half-written token file behind
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            writeTokenFile(file, tokens, code)
+        os.replace(temporary_path, path)
+    except BaseException:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        raise
+
+
+class TokenFile:
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: not a token file")
+        (
+            magic,
+            version,
+            flags,
+            types_version,
+            self.count,
+            self.lexeme_offset,
+            self.lexeme_size,
+        ) = HEADER.unpack_from(self.data)
+        if magic != TOKEN_FILE_MAGIC or version != TOKEN_FILE_VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version {TOKEN_FILE_VERSION} token file")
+        if types_version != tokenTypesVersion():
+            self.close()
+            raise ValueError(f"{path}: written for a different TokenType")
+        self.has_lexemes = bool(flags & TOKEN_FILE_LEXEMES)
+        self.has_positions = bool(flags & TOKEN_FILE_POSITIONS)
+        records_end = HEADER.size + self.count * RECORD.size
+        if len(self.data) < records_end or (
+            self.has_lexemes and len(self.data) < self.lexeme_offset + self.lexeme_size
+        ):
+            self.close()
+            raise ValueError(f"{path}: truncated token file")
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def recordIndex(self, index: int):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("token index out of range")
+        return index
+
+    def tokenAt(self, index: int):
+        start, end, _, line, column, type_value = RECORD.unpack_from(
+            self.data, HEADER.size + index * RECORD.size
+        )
+        if not self.has_positions:
+            return Token(token_types[type_value], start, end)
+        return Token(token_types[type_value], start, end, line, column)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self.tokenAt(i) for i in range(*index.indices(self.count))]
+        return self.tokenAt(self.recordIndex(index))
+
+    def __iter__(self):
+        # Records are copied out in chunks, a memoryview of the map would keep
+        # close() from unmapping it while the iterator is alive
+        records_end = HEADER.size + self.count * RECORD.size
+        chunk_size = RECORD.size * (WRITE_BUFFER_SIZE // RECORD.size)
+        for offset in range(HEADER.size, records_end, chunk_size):
+            chunk = self.data[offset : min(offset + chunk_size, records_end)]
+            for start, end, _, line, column, type_value in RECORD.iter_unpack(chunk):
+                if not self.has_positions:
+                    line = column = None
+                yield Token(token_types[type_value], start, end, line, column)
+
+    def lexeme(self, index: int) -> str | None:
+        if not self.has_lexemes:
+            return None
+        index = self.recordIndex(index)
+        offset = HEADER.size + index * RECORD.size
+        start = RECORD.unpack_from(self.data, offset)[2]
+        if index + 1 < self.count:
+            end = RECORD.unpack_from(self.data, offset + RECORD.size)[2]
+        else:
+            end = self.lexeme_size
+        table = self.lexeme_offset
+        return self.data[table + start : table + end].decode("utf-8", "surrogatepass")
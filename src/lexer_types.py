@@ -1,15 +1,60 @@
-from dataclasses import dataclass
-from enum import Enum, auto
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum, auto
 
+from lexer_token import TokenArray
 
-class LexerTokenTypeAcceptState(Enum):
+
+class LexerTokenTypeAcceptState(IntEnum):
     IN_PROGRESS = auto()
     ACCEPTED = auto()
     REJECTED = auto()
 
 
-@dataclass
+class LexerMode(Enum):
+    RECOGNIZER = auto()
+    DFA = auto()
+    DISPATCH = auto()
+    KEYWORD = auto()
+    REGEX = auto()
+    PARALLEL = auto()
+    GENERATED = auto()
+
+
+@dataclass(slots=True)
 class LexerTokenTypeState:
     acceptance: LexerTokenTypeAcceptState
-    end_at: int
-    current_state: str = "q0"
+    current_state: int = 0
+    # Class of the character being fed, see lexer_characters
+    character_class: int = 0
+
+
+@dataclass
+class LexerDfaTables:
+    character_classes: dict[str, int]
+    signature_classes: dict[tuple[bool, bool, bool, bool], int]
+    transitions: list[list[int]]
+    accepts: list[int]
+    start_state: int
+
+
+@dataclass
+class LexerProfile:
+    invocations: list[int] = field(default_factory=list)
+    live_characters: list[int] = field(default_factory=list)
+    wins: list[int] = field(default_factory=list)
+
+
+@dataclass
+class LexerEdit:
+    start: int
+    end: int
+    replacement: str
+
+
+@dataclass
+class LexerFileResult:
+    path: str
+    tokens: TokenArray | None
+    characters: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
@@ -0,0 +1,124 @@
+import argparse
+import sys
+
+import lexer_analyzer
+import lexer_codegen
+import lexer_dfa
+import lexer_dispatch
+import lexer_keywords
+import lexer_regex
+from lexer_analyzer import analyzeSource
+from lexer_benchmark import repeatToSize
+from lexer_types import LexerMode
+
+
+SCANNED_MODULES = [
+    lexer_analyzer,
+    lexer_codegen,
+    lexer_dfa,
+    lexer_dispatch,
+    lexer_keywords,
+    lexer_regex,
+]
+SCANNED_MODES = [
+    LexerMode.RECOGNIZER,
+    LexerMode.DFA,
+    LexerMode.DISPATCH,
+    LexerMode.KEYWORD,
+    LexerMode.REGEX,
+    LexerMode.GENERATED,
+]
+
+
+def buildPathologicalCorpora(size: int):
+    return {
+        "unterminated_comment": "x = 1;\n/* " + "a * b / c " * (size // 10),
+        "comment_openers": repeatToSize(["/*"], size),
+        "comment_stars": "/*" + "*" * size,
+        "unterminated_strings": repeatToSize(['"abc \\" def\n'], size),
+        "unterminated_string": '"' + "a" * size,
+        "escaped_string": '"' + "\\" * size,
+        "unterminated_chars": repeatToSize(["'abc \\' def\n"], size),
+        "quotes": repeatToSize(["\"'"], size),
+        "slashes": repeatToSize(["/"], size),
+        "minus_dots": repeatToSize(["-."], size),
+        "zero_minus": repeatToSize(["0-"], size),
+        "digit_dots": repeatToSize(["1."], size),
+        "long_number_dot": "1" * size + ".",
+        "zeros_minus": "0" * size + "-",
+    }
+
+
+def countScannedCharacters(code: str, mode: LexerMode):
+    scanned = 0
+    original_drivers = {
+        module: module.analyzeScannedSource for module in SCANNED_MODULES
+    }
+
+    def countingDriver(driver):
+        def wrapper(code_length: int, scan, tokens=None, skip=None):
+            def countingScan(start_index: int):
+                nonlocal scanned
+                result = scan(start_index)
+                scanned += min(result[2] + 1, code_length) - start_index
+                return result
+
+            return driver(code_length, countingScan, tokens, skip)
+
+        return wrapper
+
+    # Warm up lazily built tables so building them is not counted
+    analyzeSource(code[:1], mode)
+    for module, driver in original_drivers.items():
+        module.analyzeScannedSource = countingDriver(driver)
+    try:
+        tokens = analyzeSource(code, mode)
+    finally:
+        for module, driver in original_drivers.items():
+            module.analyzeScannedSource = driver
+    return scanned, len(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that lexing pathological input does linear work"
+    )
+    parser.add_argument("--modes", nargs="*", default=None, help="e.g. DFA REGEX")
+    parser.add_argument("--size", type=int, default=4000, help="chars per corpus")
+    parser.add_argument("--growth", type=int, default=4, help="size multiplier")
+    args = parser.parse_args()
+
+    modes = SCANNED_MODES
+    if args.modes:
+        modes = [LexerMode[name] for name in args.modes]
+    lexer_dfa.getDfaTables()
+    bound = lexer_dfa.dfa_rescan_bound
+    print("rescan bound: " + ("unbounded" if bound is None else f"{bound}"))
+
+    failures = 0
+    small = buildPathologicalCorpora(args.size)
+    large = buildPathologicalCorpora(args.size * args.growth)
+    for corpus_name in small:
+        for mode in modes:
+            per_char = []
+            for code in [small[corpus_name], large[corpus_name]]:
+                scanned, _ = countScannedCharacters(code, mode)
+                per_char.append(scanned / max(len(code), 1))
+            # Every scan moves the start forward by at least one character and
+            # reads at most the rescan bound past its token, so each character
+            # is read at most bound + 2 times
+            limit = None if bound is None else bound + 2
+            failed = per_char[1] > per_char[0] * 1.1 + 0.01 or (
+                limit is not None and per_char[1] > limit
+            )
+            failures += failed
+            print(
+                f"{corpus_name:<21} {mode.name:<11} "
+                f"scanned/char={per_char[0]:.2f} -> {per_char[1]:.2f}"
+                + ("  FAILED" if failed else "")
+            )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
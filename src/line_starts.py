@@ -1,9 +1,17 @@
+import re
+from bisect import bisect_right
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+newline = re.compile("\n")
+
+
 def build_line_starts(text: str):
-    line_starts = [0]
-    for i, c in enumerate(text):
-        if c == "\n":
-            line_starts.append(i + 1)
-    return line_starts
+    return [0] + [match.end() for match in newline.finditer(text)]
 
 
 def index_to_line_col_batch(idx: int, line_starts: list[int]):
@@ -17,3 +25,43 @@ def index_to_line_col_batch(idx: int, line_starts: list[int]):
     line = high + 1
     col = idx - line_starts[high] + 1
     return line, col
+
+
+def indexes_to_line_cols(indexes, line_starts: list[int]):
+    if numpy is not None:
+        starts = numpy.asarray(line_starts)
+        offsets = numpy.asarray(indexes)
+        lines = numpy.searchsorted(starts, offsets, side="right")
+        cols = offsets - starts[lines - 1] + 1
+        return list(zip(lines.tolist(), cols.tolist()))
+
+    # Sorted indexes only ever move forward through the line starts
+    result = []
+    line = 0
+    last_line = len(line_starts) - 1
+    for idx in indexes:
+        if idx < line_starts[line]:
+            line = bisect_right(line_starts, idx) - 1
+        while line < last_line and line_starts[line + 1] <= idx:
+            line += 1
+        result.append((line + 1, idx - line_starts[line] + 1))
+    return result
+
+
+def update_line_starts(line_starts: list[int], start: int, end: int, replacement: str):
+    # Line starts that came from newlines in the replaced text are dropped,
+    # the ones after it move by the change in length
+    first = bisect_right(line_starts, start)
+    last = bisect_right(line_starts, end)
+    delta = len(replacement) - (end - start)
+    line_starts[first:] = [
+        start + match.end() for match in newline.finditer(replacement)
+    ] + [line_start + delta for line_start in line_starts[last:]]
+    return line_starts
+
+
+def token_line_col(token, line_starts: list[int]):
+    # Tokens lexed with position tracking already carry their line and column
+    if token.line is not None:
+        return token.line, token.column
+    return index_to_line_col_batch(token.start, line_starts)
@@ -1,61 +1,40 @@
-import sys
-import json
+import argparse
 
 from ast_converter import convertCstToAst
 from lexer_analyzer import analyzeSource
-from lexer_token import Token, TokenType
+from lexer_export import EXPORT_FORMATS, dumpTokens
+from lexer_token import TokenArray
+from lexer_mmap import normalizeNewlines
 from syntax_analyzer import NodeType, parseFile
 from semantic_analyzer import resolveFile
 from syntax_analyzer import parseFile
-from line_starts import build_line_starts, index_to_line_col_batch
+from line_starts import build_line_starts, token_line_col
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage:", sys.argv[0], "[file] [optional: save file]")
-        return
-    file = open(sys.argv[1], "r")
-    code = file.read()
-    code = code.replace("\r\n", "\n")
-    code = code.replace("\n\r", "\n")
-    code = code.replace("\r", "\n")
-    tokens = analyzeSource(code)
-    token_list = []
+    parser = argparse.ArgumentParser()
+    parser.add_argument("file")
+    parser.add_argument("save_file", nargs="?", help="token dump")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="json")
+    args = parser.parse_args()
+
+    # The dump streams the file through its own pass, so it is written as
+    # tokens come out of the lexer and never holds the whole source
+    if args.save_file is not None:
+        with open(args.file, "r") as file:
+            dumpTokens(file, args.save_file, args.format)
+
+    file = open(args.file, "r")
+    code = normalizeNewlines(file.read())
+    tokens = analyzeSource(code, tokens=TokenArray(), skip_trivia=True, positions=True)
     line_starts = build_line_starts(code)
-    for t in tokens:
-        start_line, start_col = index_to_line_col_batch(t.start, line_starts)
-        end_line, end_col = index_to_line_col_batch(t.end, line_starts)
-        token_list.append(
-            {
-                "type": str(t.type.name),
-                "start": int(t.start),
-                "end": int(t.end),
-                "start_line": start_line,
-                "start_col": start_col,
-                "end_line": end_line,
-                "end_col": end_col,
-                "lexeme": code[t.start : t.end],
-            }
-        )
-    # print(tokens)
     file.close()
-    if len(sys.argv) >= 3:
-        with open(sys.argv[2], "w") as f:
-            json.dump(token_list, f, indent=2)
-
-    def filterTokens(token: Token):
-        return not (
-            token.type == TokenType.WHITESPACE
-            or token.type == TokenType.NEWLINE
-            or token.type == TokenType.COMMENT
-        )
 
-    tokens = list(filter(filterTokens, tokens))
     result, has_error = parseFile(tokens)
     for i in result.children:
         if i.kind == NodeType.ERROR:
             print(i)
-            start_line, start_col = index_to_line_col_batch(i.token.start, line_starts)
+            start_line, start_col = token_line_col(i.token, line_starts)
             print(f"{start_line}:{start_col}")
     if has_error:
         print(result.pretty(code, line_starts, 4))
@@ -1,9 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from llvmlite import ir
+from typing import TYPE_CHECKING
 from lexer_token import Token, TokenType
 
+if TYPE_CHECKING:
+    from llvmlite import ir
+
 
 class BuiltInTypes(Enum):
     VOID_TYPE = 1
@@ -1,9 +1,9 @@
-from lexer_token import Token, TokenType
+from lexer_token import Token, TokenArray, TokenType
 from syntax_types import Node, NodeType
 from result import Ok, Error, Result
 
 
-def parseFile(tokens: list[Token]) -> tuple[Node, bool]:
+def parseFile(tokens: list[Token] | TokenArray) -> tuple[Node, bool]:
     token_index = 0
     tokens_len = len(tokens)
     current_token: Token = tokens[token_index]
@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any
-from line_starts import index_to_line_col_batch
+from line_starts import token_line_col
 from lexer_token import Token
 
 
@@ -113,9 +113,7 @@ class Node:
             line += f"{pad}data={self.data}"
 
         if self.token is not None:
-            start_line, start_col = index_to_line_col_batch(
-                self.token.start, line_starts
-            )
+            start_line, start_col = token_line_col(self.token, line_starts)
             line += f" @ {self.token.type.name} @ '{code[self.token.start : self.token.end]}' @ {start_line}:{start_col}"
 
         lines = [line]
@@ -128,9 +126,7 @@ class Node:
     def errors(self, code: str, line_starts: list) -> str:
         line = ""
         if self.data is not None and self.kind is NodeType.ERROR:
-            start_line, start_col = index_to_line_col_batch(
-                self.token.start, line_starts
-            )
+            start_line, start_col = token_line_col(self.token, line_starts)
             line += f"{self.kind.name}: {self.data} @ {start_line}:{start_col}\n"
         lines = [line]
         for child in self.children: